@@ -41,6 +41,7 @@ a = Analysis(
     binaries=[],
     datas=[
         ('python/iran-ipv4.cidrs', '.'),
+        ('python/dnsscanner.tcss', '.'),
         ('python/slipstream-client', 'slipstream-client'),
         ('python/slipnet-client', 'slipnet-client'),
         *textual_datas,
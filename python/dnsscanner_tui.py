@@ -12,14 +12,12 @@ from __future__ import annotations
 import asyncio
 import gc
 import os
-import platform
 import random
 import subprocess
 import sys
 import time
-from collections import deque
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import Set
 
 import dns.asyncresolver
 import dns.exception
@@ -41,6 +39,44 @@ from textual.widgets import (
 )
 
 
+# Max log lines held between UI flushes; older lines are dropped beyond this.
+LOG_BUFFER_MAX = 500
+
+# Per-scan LRU of DNS probe verdicts (ip -> (alive, response_time)).
+DNS_CACHE_MAX = 200_000
+
+# RIS (full reset) + show cursor, written on quit.
+_TERMINAL_RESET = "\x1bc\x1b[?25h"
+
+# Invariant Rich-markup prefixes for the scan header, filled with str.format.
+_TMPL = {
+    "subnet": "[yellow]Subnet file:[/yellow] {}",
+    "domain": "[yellow]Domain:[/yellow] {}",
+    "domain_cfg": "[yellow]Domain (from config):[/yellow] {}",
+    "slipnet_url": "[yellow]SlipNet URL:[/yellow] {}...",
+    "concurrency": "[yellow]Concurrency:[/yellow] {}",
+    "preset": "[yellow]Scan Preset:[/yellow] {}",
+    "dns_timeout": "[yellow]DNS Timeout:[/yellow] {}s",
+    "proxy_timeout": "[yellow]Proxy Timeout:[/yellow] {}s",
+    "test_url": "[yellow]Proxy Test URL:[/yellow] {}",
+    "min_ping": "[yellow]Minimum Ping to Test:[/yellow] {}ms",
+    "extra_tests": "[yellow]Extra Tests:[/yellow] {}",
+    "proxy": "[yellow]Proxy Test:[/yellow] {}",
+    "proxy_enabled": "[yellow]Proxy Test:[/yellow] Enabled ({})",
+    "auth_mode": "[yellow]Auth Mode:[/yellow] {}",
+}
+
+# Scan-control buttons that are debounced against rapid repeat presses.
+_DEBOUNCED_BUTTONS = frozenset(("start-scan-btn", "pause-btn", "resume-btn", "shuffle-btn"))
+BUTTON_DEBOUNCE_S = 0.05
+
+
+def _set_display(widget, value: bool) -> None:
+    """Set ``widget.display`` only when it changes, avoiding a layout pass."""
+    if widget.display != value:
+        widget.display = value
+
+
 def _resource_path(relative: str) -> Path:
     """Resolve a bundled resource path.
 
@@ -58,7 +94,6 @@ try:
         # Constants / platform
         _copy_to_clipboard,
         _read_from_clipboard,
-        re,
         logger,
         # Widgets
         Checkbox,
@@ -66,6 +101,7 @@ try:
         StatsWidget,
         VersionedFooter,
         # Standalone classes
+        ResultRow,
         SlipstreamManager,
         SlipNetManager,
         # Mixins (compose into DNSScannerTUI via multiple inheritance)
@@ -81,7 +117,6 @@ except ImportError:
         # Constants / platform
         _copy_to_clipboard,
         _read_from_clipboard,
-        re,
         logger,
         # Widgets
         Checkbox,
@@ -89,6 +124,7 @@ except ImportError:
         StatsWidget,
         VersionedFooter,
         # Standalone classes
+        ResultRow,
         SlipstreamManager,
         SlipNetManager,
         # Mixins (compose into DNSScannerTUI via multiple inheritance)
@@ -116,385 +152,7 @@ class DNSScannerTUI(
     # Set Dracula theme as default
     ENABLE_COMMAND_PALETTE = False  # Disable command palette
 
-    CSS = """
-    Screen {
-        background: #0d1117;
-    }
-    
-    /* Dark theme colors */
-    Header {
-        background: #161b22;
-        color: #58a6ff;
-    }
-    
-    Footer {
-        background: #161b22;
-        color: #8b949e;
-    }
-    
-    Footer > .footer--key {
-        background: #21262d;
-        color: #58a6ff;
-    }
-    
-    Footer > .footer--description {
-        color: #c9d1d9;
-    }
-
-    /* Start Screen Styles */
-    #start-screen {
-        width: 100%;
-        height: 100%;
-        background: #0d1117;
-        padding: 1;
-    }
-    
-    #start-form {
-        width: 100%;
-        height: auto;
-        max-height: 100%;
-        border: solid #30363d;
-        background: #161b22;
-        padding: 2;
-        overflow-y: auto;
-    }
-    
-    .form-row {
-        width: 100%;
-        height: auto;
-        min-height: 3;
-        margin: 1 0;
-        align: left middle;
-    }
-    
-    .form-label {
-        width: 20;
-        padding: 0 1;
-        color: #c9d1d9;
-        content-align: left middle;
-        align: left middle;
-    }
-
-    .field-label {
-        width: 100%;
-        text-align: center;
-        content-align: center middle;
-        color: #8b949e;
-        padding: 0 0 1 0;
-    }
-
-    .form-field {
-        width: 1fr;
-        height: auto;
-        padding: 0 1;
-    }
-    
-    .form-input {
-        width: 1fr;
-    }
-    
-    Input {
-        background: #21262d;
-        border: solid #30363d;
-        color: #c9d1d9;
-        height: 3;
-    }
-    
-    Input:focus {
-        border: solid #58a6ff;
-    }
-    
-    #file-browser-container {
-        width: 100%;
-        height: 10;
-        max-height: 15;
-        border: solid #238636;
-        background: #161b22;
-        margin: 1 0;
-        display: none;
-    }
-    
-    DirectoryTree {
-        height: 100%;
-        background: #161b22;
-        color: #c9d1d9;
-    }
-    
-    DirectoryTree:focus > .directory-tree--folder {
-        color: #58a6ff;
-    }
-    
-    Select {
-        width: 1fr;
-        background: #21262d;
-        border: solid #30363d;
-    }
-    
-    Select.-expanded {
-        height: auto;
-    }
-    
-    SelectCurrent {
-        background: #21262d;
-        color: #c9d1d9;
-        padding: 0 1;
-    }
-    
-    Select > SelectOverlay {
-        background: #161b22;
-        border: solid #58a6ff;
-        width: 100%;
-    }
-    
-    Select > SelectOverlay > OptionList {
-        background: #161b22;
-        color: #c9d1d9;
-        padding: 0;
-        height: auto;
-    }
-    
-    Select > SelectOverlay > OptionList > .option-list--option {
-        padding: 0 1;
-        background: #161b22;
-        color: #c9d1d9;
-    }
-    
-    Select > SelectOverlay > OptionList > .option-list--option-highlighted {
-        background: #30363d;
-        color: #58a6ff;
-    }
-    
-    Select > SelectOverlay > OptionList > .option-list--option-hover {
-        background: #21262d;
-    }
-    
-    #start-buttons {
-        width: 100%;
-        height: auto;
-        align: center middle;
-        margin-top: 2;
-    }
-    
-    #proxy-auth-container {
-        width: 100%;
-        height: auto;
-        display: none;
-        padding: 0;
-        margin: 0;
-    }
-
-    #slipnet-fields-container {
-        width: 100%;
-        height: auto;
-        display: none;
-        padding: 0;
-        margin: 0;
-    }
-
-    #slipstream-auth-sub {
-        width: 100%;
-        height: auto;
-        padding: 0;
-        margin: 0;
-    }
-
-    #socks5-auth-container {
-        width: 100%;
-        height: auto;
-        display: none;
-        padding: 0;
-        margin: 0;
-    }
-
-    #ssh-auth-container {
-        width: 100%;
-        height: auto;
-        display: none;
-        padding: 0;
-        margin: 0;
-    }
-
-    #protocol-auth-section {
-        width: 100%;
-        height: auto;
-        border: solid #30363d;
-        background: #0d1117;
-        padding: 1 2;
-        margin: 0 0 1 0;
-    }
-    
-    /* Scan Screen Styles */
-    #scan-screen {
-        width: 100%;
-        height: 100%;
-        background: #0d1117;
-    }
-
-    #stats {
-        width: 1fr;
-        height: 100%;
-        border: solid #238636;
-        background: #161b22;
-        padding: 1;
-        margin: 1;
-        color: #c9d1d9;
-    }
-
-    #stats-logs-container {
-        width: 100%;
-        height: 18;
-    }
-
-    #results {
-        width: 100%;
-        height: 1fr;
-        background: #161b22;
-        margin: 0 1;
-        padding: 1;
-    }
-
-    #logs {
-        width: 1fr;
-        height: 100%;
-        border: solid #d29922;
-        background: #161b22;
-        margin: 1;
-        padding: 1;
-    }
-
-    #log-display {
-        height: 100%;
-    }
-    
-    .hidden {
-        display: none;
-    }
-
-    #controls {
-        width: 100%;
-        height: auto;
-        margin: 1;
-        align: center middle;
-    }
-
-    Button {
-        margin: 0 1;
-        background: #21262d;
-        color: #c9d1d9;
-        border: solid #30363d;
-    }
-    
-    Button:hover {
-        background: #30363d;
-        color: #58a6ff;
-    }
-    
-    Button:focus {
-        border: solid #58a6ff;
-    }
-    
-    Button.-primary {
-        background: #238636;
-        color: #ffffff;
-        border: solid #238636;
-    }
-    
-    Button.-primary:hover {
-        background: #2ea043;
-    }
-
-    #clear-slipnet-btn {
-        width: 10;
-        min-width: 10;
-        height: 3;
-        margin: 0 0 0 1;
-    }
-
-    DataTable {
-        height: 100%;
-        background: #161b22;
-    }
-    
-    DataTable > .datatable--header {
-        background: #21262d;
-        color: #58a6ff;
-        text-style: bold;
-    }
-    
-    DataTable > .datatable--cursor {
-        background: #30363d;
-        color: #c9d1d9;
-    }
-    
-    DataTable > .datatable--hover {
-        background: #21262d;
-    }
-
-    RichLog {
-        height: 100%;
-        background: #161b22;
-        color: #c9d1d9;
-        scrollbar-size: 0 1;
-    }
-    
-    Checkbox {
-        background: transparent;
-        color: #8b949e;
-        margin-right: 2;
-    }
-
-    Checkbox > .toggle--button {
-        background: transparent;
-        border: solid #30363d;
-        color: #8b949e;
-        width: 3;
-    }
-
-    Checkbox.-on {
-        color: #c9d1d9;
-    }
-
-    Checkbox.-on > .toggle--button {
-        background: #238636;
-        border: solid #238636;
-        color: #ffffff;
-    }
-
-    Checkbox:focus > .toggle--button {
-        border: solid #58a6ff;
-    }
-    
-    .checkbox-row {
-        align: center middle;
-        height: auto;
-        padding: 1 0;
-    }
-
-    .domain-row {
-        height: 6;
-    }
-
-    .domain-checkboxes {
-        width: auto;
-        height: 100%;
-        align: left middle;
-        padding: 0 2;
-        margin-top: 2;
-    }
-
-    .domain-field {
-        align: center top;
-    }
-
-    #advanced-settings-container {
-        display: none;
-        height: auto;
-        padding: 0 2;
-        margin: 0 0 1 0;
-        border: solid #30363d;
-        background: #0d1117;
-    }
-    """
+    CSS_PATH = str(_resource_path("dnsscanner.tcss"))
 
     BINDINGS = [
         ("s", "start_scan", "Start"),
@@ -542,6 +200,8 @@ class DNSScannerTUI(
         # ISP cache file path — kept in cwd so it is always writable,
         # even when running as a frozen PyInstaller one-file EXE.
         self._isp_cache_path = Path("isp_cache.json")
+        # Results directory — created once by main() before the app starts.
+        self._results_dir = Path("results")
 
         # Scan strategy: "shuffle" (random order) or "redis" (pincer from edges)
         self.scan_strategy = "redis"
@@ -572,23 +232,38 @@ class DNSScannerTUI(
         self.extra_test_tasks: set = set()  # Track running extra test tasks
         self.extra_test_semaphore: asyncio.Semaphore | None = None  # Limits concurrent extra tests
 
-        # Incremental pass/fail counters (avoids O(n) scans of proxy_results)
+        # Proxy-status tallies, maintained by _set_proxy_status (avoids O(n)
+        # scans of proxy statuses)
         self._passed_count = 0
         self._failed_count = 0
+        self._pending_count = 0  # Pending + Testing
+        # Security-summary tallies, maintained by _set_security_result
+        self._secure_count = 0
+        self._normal_count = 0
+        self._filtered_count = 0
 
         # Cached widget references (populated in on_mount)
         self._stats_widget: "StatsWidget | None" = None
+        self._log_widget: RichLog | None = None
+        self._results_table: DataTable | None = None
+        self._btn_pause: Button | None = None
+        self._btn_resume: Button | None = None
+        self._btn_shuffle: Button | None = None
+        self._controls: Horizontal | None = None
 
         # Config file for caching settings
         self.config_dir = Path.home() / ".pydns-scanner"
         self.config_file = self.config_dir / "config.json"
+        self._config_cache: dict = {}  # Parsed config.json, read once
+        self._load_config_once()
 
-        self.slipstream_manager = SlipstreamManager()
-        self.slipstream_path = str(self.slipstream_manager.get_executable_path())
+        # Tunnel client managers are built on first use (see properties below)
+        self._slipstream_manager: SlipstreamManager | None = None
+        self._slipstream_path: str | None = None
         self.slipstream_domain = ""
 
         # SlipNet protocol support
-        self.slipnet_manager = SlipNetManager()
+        self._slipnet_manager: SlipNetManager | None = None
         self.active_protocol: str = "slipstream"  # "slipstream", "slipnet", or "dns_scan"
         self.slipnet_url: str = ""
         self.auth_mode: str = "none"  # "none", "socks5", "ssh"
@@ -601,52 +276,91 @@ class DNSScannerTUI(
 
         # whether to perform the full HTTP/SOCKS check after slipstream starts
 
-        self.found_servers: Set[str] = set()  # Keep found servers for results
-        self.server_times: dict[str, float] = {}
-        self.proxy_results: dict[str, str] = (
-            {}
-        )  # IP -> "Success", "Failed", or "Testing"
+        self._results: dict[str, ResultRow] = {}  # IP -> response time + proxy status
         self.start_time = 0.0
         self._paused_elapsed: float = 0.0
         self._pause_started_at: float = 0.0
+        # Sliding-window speed: EWMA over ~1 s samples of current_scanned
+        self._ewma_speed: float = 0.0
+        self._speed_last_count = 0
+        self._speed_last_mono: float = 0.0
+        # Set once the DNS sweep ends; late proxy results must not move it
+        self._final_elapsed: float | None = None
         self.last_update_time = 0.0
-        self.last_table_update_time = 0.0
         self.current_scanned = 0
         self._current_scanning_ip: str = ""
         self._current_scanning_range: str = ""
-        self.table_needs_rebuild = False
+        # Set whenever the sort order may have changed; _resort_loop
+        # coalesces requests into one rebuild per RESORT_DEBOUNCE_S.
+        self._resort_event = asyncio.Event()
+        self._resort_task: asyncio.Task | None = None
+        # Found IPs awaiting a table row, and whether stats need a repaint;
+        # both are drained by the _flush_ui timer.
+        self._pending_rows: list[str] = []
+        self._row_order: list[str] = []  # IPs in current table display order
+        self._stats_dirty = False
+        # Log lines queued by _log(); written to the RichLog in one call per tick
+        self._log_buffer: list[str] = []
+        self._log_dropped = 0
         self.scan_started = False
         self.is_paused = False
         self.pause_event = asyncio.Event()
         self.pause_event.set()  # Not paused initially
 
-        # Button spam protection
-        self._processing_button = False
+        # Button spam protection: presses inside BUTTON_DEBOUNCE_S are dropped
+        self._last_button_mono: float = 0.0
+        self._tree_mounted = False  # PlainDirectoryTree mounted lazily
 
         # Slipstream parallel testing config
         self.slipstream_max_concurrent = 3
         self.slipstream_base_port = 10800  # Base port, will use 10800-10804
-        self.available_ports: deque = deque()  # Available ports for testing
-        self.slipstream_semaphore: asyncio.Semaphore = (
-            None  # Will be created in async context
-        )
-        self.pending_slipstream_tests: deque = deque()  # Queue for pending tests
-        self.slipstream_tasks: set = set()  # Track running slipstream tasks
-        self.active_scan_tasks: list = []  # Track active DNS scan tasks for cleanup
-        self._shutdown_event: asyncio.Event = None  # Signal for graceful shutdown
+        # Free proxy ports; doubles as the concurrency gate for proxy tests
+        self.available_ports: asyncio.Queue[int] = asyncio.Queue()
+        self.pending_slipstream_tests: deque = deque()  # IPs waiting for a test task slot
+        self._proxy_clients: dict[str, httpx.AsyncClient] = {}  # SOCKS5 URL -> client
+        self._proxy_urls: dict[int, tuple[str, str]] = {}  # port -> (url, url for logs)
+        self.slipstream_tasks: set = set()  # Running tests, capped by _spawn_slipstream_tests
+        self.active_scan_tasks: set[asyncio.Task] = set()  # Active DNS scan tasks, for cleanup
+        self._shutdown_event = asyncio.Event()  # Signal for graceful shutdown; cleared per scan
         self.slipstream_processes: list = (
             []
         )  # Track all slipstream processes for cleanup
 
         # Shuffle support - memory efficient
-        self.remaining_ips: list = []
         self.shuffle_signal: asyncio.Event | None = None  # Signal to reshuffle during scan
         self.tested_subnets: set[int] = set()  # Track completed /24 blocks as int(network_address)
+        self._subnet_cache: tuple | None = None  # ((path, mtime_ns, size), parsed subnets)
+        self._dns_cache: OrderedDict[str, tuple[bool, float]] = OrderedDict()
 
         # Debug logging support
         self.debug_mode: bool = False
         self._debug_log_file = None
 
+    @property
+    def slipstream_manager(self) -> SlipstreamManager:
+        """Slipstream client manager, constructed when first needed."""
+        if self._slipstream_manager is None:
+            self._slipstream_manager = SlipstreamManager()
+        return self._slipstream_manager
+
+    @property
+    def slipnet_manager(self) -> SlipNetManager:
+        """SlipNet client manager, constructed when first needed."""
+        if self._slipnet_manager is None:
+            self._slipnet_manager = SlipNetManager()
+        return self._slipnet_manager
+
+    @property
+    def slipstream_path(self) -> str:
+        """Path to the slipstream executable, resolved when first needed."""
+        if self._slipstream_path is None:
+            self._slipstream_path = str(self.slipstream_manager.get_executable_path())
+        return self._slipstream_path
+
+    @slipstream_path.setter
+    def slipstream_path(self, value: str) -> None:
+        self._slipstream_path = value
+
     def compose(self) -> ComposeResult:
         """Create child widgets."""
         yield Header(show_clock=False)
@@ -676,8 +390,8 @@ class DNSScannerTUI(
                             id="input-preset",
                         )
 
-                with Container(id="file-browser-container"):
-                    yield PlainDirectoryTree(".", id="file-browser")
+                # The directory tree is mounted on first "Custom File..." pick
+                yield Container(id="file-browser-container")
 
                 with Container(id="protocol-auth-section"):
                     yield Label("Protocol:", classes="field-label")
@@ -1031,17 +745,26 @@ class DNSScannerTUI(
         # Cache frequently accessed widget references
         try:
             self._stats_widget = self.query_one("#stats", StatsWidget)
+            self._log_widget = self.query_one("#log-display", RichLog)
+            self._results_table = self.query_one("#results-table", DataTable)
+            self._btn_pause = self.query_one("#pause-btn", Button)
+            self._btn_resume = self.query_one("#resume-btn", Button)
+            self._btn_shuffle = self.query_one("#shuffle-btn", Button)
+            self._controls = self.query_one("#controls", Horizontal)
         except Exception as e:
             logger.debug(f"Could not cache widget refs: {e}")
 
         # Hide pause/resume/shuffle buttons initially
         try:
-            self.query_one("#pause-btn", Button).display = False
-            self.query_one("#resume-btn", Button).display = False
-            self.query_one("#shuffle-btn", Button).display = False
+            self._btn_pause.display = False
+            self._btn_resume.display = False
+            self._btn_shuffle.display = False
         except Exception as e:
             logger.debug(f"Could not hide buttons during mount: {e}")
 
+        # Coalesce result rows, log lines and stats repaints into ~10 UI updates/sec
+        self.set_interval(0.1, self._flush_ui)
+
     def _get_table_columns(self) -> list[tuple[str, str, int | None]]:
         """Return list of (label, key, width) for unified results table."""
         cols: list[tuple[str, str, int | None]] = []
@@ -1063,6 +786,7 @@ class DNSScannerTUI(
         try:
             table = self.query_one("#results-table", DataTable)
             table.clear(columns=True)
+            self._row_order = []
             for label, key, width in self._get_table_columns():
                 table.add_column(label, key=key, width=width)
             table.cursor_type = "row"
@@ -1072,8 +796,7 @@ class DNSScannerTUI(
     def action_quit(self) -> None:
         """Gracefully quit the application with proper cleanup."""
         # Signal shutdown to stop any running scans
-        if self._shutdown_event:
-            self._shutdown_event.set()
+        self._shutdown_event.set()
         if self.shuffle_signal:
             self.shuffle_signal.set()  # Unblock any shuffle wait
 
@@ -1109,10 +832,7 @@ class DNSScannerTUI(
                         task.cancel()
                 except Exception as e:
                     logger.debug(f"Could not cancel scan task: {e}")
-            if isinstance(self.active_scan_tasks, set):
-                self.active_scan_tasks.clear()
-            else:
-                self.active_scan_tasks = []
+            self.active_scan_tasks.clear()
 
         # Cancel all slipstream test tasks
         if hasattr(self, "slipstream_tasks"):
@@ -1151,15 +871,24 @@ class DNSScannerTUI(
                 pass
             self._http_client = None
 
+        # Close cached proxy-test clients
+        if getattr(self, "_proxy_clients", None):
+            try:
+                import asyncio as _aio
+                loop = _aio.get_event_loop()
+                if loop.is_running():
+                    loop.create_task(self._close_proxy_clients())
+                else:
+                    loop.run_until_complete(self._close_proxy_clients())
+            except Exception:
+                pass
+
         # Cancel all Textual workers
         try:
             self.workers.cancel_all()
         except Exception as e:
             logger.debug(f"Could not cancel workers: {e}")
 
-        # Force garbage collection
-        gc.collect()
-
         # Close debug log if still open
         self._close_debug_log()
 
@@ -1172,7 +901,7 @@ class DNSScannerTUI(
             logger.debug(f"Could not stop application mode: {e}")
 
         # Reset terminal on different platforms
-        if platform.system() == "Windows":
+        if sys.platform == "win32":
             # Windows: reset console mode
             try:
                 import ctypes
@@ -1185,17 +914,15 @@ class DNSScannerTUI(
                 # Also restore stdin
                 stdin_handle = kernel32.GetStdHandle(-10)  # STD_INPUT_HANDLE
                 kernel32.SetConsoleMode(stdin_handle, 0x0080 | 0x0001 | 0x0002 | 0x0004)
-                # Show cursor
-                print("\033[?25h", end="", flush=True)
             except (ImportError, AttributeError, OSError) as e:
                 logger.debug(f"Windows terminal reset failed: {e}")
-        else:
-            # Unix: reset terminal with stty
-            try:
-                subprocess.run(["stty", "sane"], check=False, capture_output=True)
-                print("\033[?25h", end="", flush=True)  # Show cursor
-            except (FileNotFoundError, subprocess.SubprocessError) as e:
-                logger.debug(f"Unix terminal reset failed: {e}")
+        # Reset the terminal and show the cursor with escape codes rather than
+        # forking `stty sane`; the Textual driver has already restored tty modes.
+        try:
+            sys.stdout.write(_TERMINAL_RESET)
+            sys.stdout.flush()
+        except (OSError, ValueError) as e:
+            logger.debug(f"Terminal reset failed: {e}")
 
         # Revert OS MTU before exit
         self._revert_os_mtu()
@@ -1216,7 +943,6 @@ class DNSScannerTUI(
             self._pause_scan()
             self._update_keybinding_visibility(scanning=True, paused=True)
             # Rebuild table when paused so user sees sorted results
-            self.table_needs_rebuild = True
             self._rebuild_table()
 
     def action_resume_scan(self) -> None:
@@ -1227,13 +953,11 @@ class DNSScannerTUI(
 
     def action_shuffle_ips(self) -> None:
         """Keybinding action to shuffle IPs - instant, no pause needed."""
-        if self.scan_started and not (self._shutdown_event and self._shutdown_event.is_set()):
+        if self.scan_started and not self._shutdown_event.is_set():
             if self.shuffle_signal:
                 self.shuffle_signal.set()
                 self._log("[cyan]Shuffle requested - reshuffling IP order...[/cyan]")
                 self.notify("Shuffling IP order...", severity="information", timeout=2)
-                # Force immediate yield to process shuffle signal
-                self.call_later(lambda: None)
     
     def action_start_scan(self) -> None:
         """Keybinding action to start scan from config screen."""
@@ -1247,65 +971,55 @@ class DNSScannerTUI(
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button clicks."""
-        # Prevent button spam crashes
-        if event.button.id in [
-            "start-scan-btn",
-            "pause-btn",
-            "resume-btn",
-            "shuffle-btn",
-        ]:
-            if self._processing_button:
+        # Prevent button spam crashes: drop (don't queue) rapid repeat presses
+        if event.button.id in _DEBOUNCED_BUTTONS:
+            now = time.monotonic()
+            if now - self._last_button_mono < BUTTON_DEBOUNCE_S:
                 return
-            self._processing_button = True
+            self._last_button_mono = now
 
-        try:
-            if event.button.id == "start-scan-btn":
-                self._start_scan_from_form()
-            elif event.button.id == "exit-btn":
-                self.action_quit()
-            elif event.button.id == "clear-slipnet-btn":
-                try:
-                    slipnet_input = self.query_one("#input-slipnet-url", Input)
-                    slipnet_input.value = ""
-                    slipnet_input.focus()
-                    self.notify("SlipNet URL cleared", severity="information", timeout=1)
-                except Exception as e:
-                    logger.debug(f"Could not clear SlipNet URL input: {e}")
-            elif event.button.id == "pause-btn":
-                self._pause_scan()
-                # Rebuild table when paused so user sees sorted results
-                self.table_needs_rebuild = True
-                self._rebuild_table()
-                self._update_keybinding_visibility(scanning=True, paused=True)
-            elif event.button.id == "resume-btn":
-                self._resume_scan()
-                self._update_keybinding_visibility(scanning=True, paused=False)
-            elif event.button.id == "shuffle-btn":
-                # Instant shuffle - no pause needed
-                self.action_shuffle_ips()
-            elif event.button.id == "save-btn":
-                self.action_save_results()
-            elif event.button.id == "quit-btn":
-                self.action_quit()
-        finally:
-            if event.button.id in [
-                "start-scan-btn",
-                "pause-btn",
-                "resume-btn",
-                "shuffle-btn",
-            ]:
-                self._processing_button = False
+        if event.button.id == "start-scan-btn":
+            self._start_scan_from_form()
+        elif event.button.id == "exit-btn":
+            self.action_quit()
+        elif event.button.id == "clear-slipnet-btn":
+            try:
+                slipnet_input = self.query_one("#input-slipnet-url", Input)
+                slipnet_input.value = ""
+                slipnet_input.focus()
+                self.notify("SlipNet URL cleared", severity="information", timeout=1)
+            except Exception as e:
+                logger.debug(f"Could not clear SlipNet URL input: {e}")
+        elif event.button.id == "pause-btn":
+            self._pause_scan()
+            # Rebuild table when paused so user sees sorted results
+            self._rebuild_table()
+            self._update_keybinding_visibility(scanning=True, paused=True)
+        elif event.button.id == "resume-btn":
+            self._resume_scan()
+            self._update_keybinding_visibility(scanning=True, paused=False)
+        elif event.button.id == "shuffle-btn":
+            # Instant shuffle - no pause needed
+            self.action_shuffle_ips()
+        elif event.button.id == "save-btn":
+            self.action_save_results()
+        elif event.button.id == "quit-btn":
+            self.action_quit()
 
     def on_select_changed(self, event: Select.Changed) -> None:
         """Handle CIDR dropdown selection changes."""
         if event.select.id == "input-cidr-select":
             browser = self.query_one("#file-browser-container")
             if event.value == "custom":
+                # Walk the CWD only once the user actually wants to browse
+                if not self._tree_mounted:
+                    self._tree_mounted = True
+                    browser.mount(PlainDirectoryTree(".", id="file-browser"))
                 # Show file browser when Custom is selected
-                browser.display = True
+                _set_display(browser, True)
             else:
                 # Hide browser for other selections
-                browser.display = False
+                _set_display(browser, False)
 
     def on_checkbox_changed(self, event: Checkbox.Changed) -> None:
         """Handle checkbox state changes."""
@@ -1314,7 +1028,7 @@ class DNSScannerTUI(
         if cb_id == "input-show-advanced":
             try:
                 container = self.query_one("#advanced-settings-container")
-                container.display = event.value
+                _set_display(container, event.value)
             except Exception as e:
                 logger.debug(f"Could not toggle advanced settings container: {e}")
 
@@ -1330,32 +1044,32 @@ class DNSScannerTUI(
                             self.query_one(f"#{other_id}", Checkbox).value = False
                     is_slipnet = (cb_id == "proto-slipnet")
                     is_dns_scan = (cb_id == "proto-dns-scan")
-                    self.query_one("#slipnet-fields-container").display = is_slipnet
+                    _set_display(self.query_one("#slipnet-fields-container"), is_slipnet)
                     for row in self.query(".domain-row"):
-                        row.display = not is_slipnet
+                        _set_display(row, not is_slipnet)
                     # Hide auth UI for SlipNet and DNS Scan
                     try:
-                        self.query_one("#slipstream-auth-sub").display = not is_slipnet and not is_dns_scan
+                        _set_display(self.query_one("#slipstream-auth-sub"), not is_slipnet and not is_dns_scan)
                         if is_slipnet or is_dns_scan:
-                            self.query_one("#socks5-auth-container").display = False
-                            self.query_one("#ssh-auth-container").display = False
+                            _set_display(self.query_one("#socks5-auth-container"), False)
+                            _set_display(self.query_one("#ssh-auth-container"), False)
                     except Exception:
                         pass
                     # Show query-size setting only for SlipNet
                     try:
-                        self.query_one("#slipnet-query-size-container").display = is_slipnet
+                        _set_display(self.query_one("#slipnet-query-size-container"), is_slipnet)
                     except Exception:
                         pass
                     # DNS Scan: hide & disable proxy test, advanced, random subdomain
                     try:
-                        self.query_one("#input-slipstream", Checkbox).display = not is_dns_scan
+                        _set_display(self.query_one("#input-slipstream", Checkbox), not is_dns_scan)
                         if is_dns_scan:
                             self.query_one("#input-slipstream", Checkbox).value = False
-                        self.query_one("#input-show-advanced", Checkbox).display = not is_dns_scan
+                        _set_display(self.query_one("#input-show-advanced", Checkbox), not is_dns_scan)
                         if is_dns_scan:
-                            self.query_one("#advanced-settings-container").display = False
-                        self.query_one("#domain-options").display = not is_dns_scan
-                        self.query_one("#input-random", Checkbox).display = not is_dns_scan
+                            _set_display(self.query_one("#advanced-settings-container"), False)
+                        _set_display(self.query_one("#domain-options"), not is_dns_scan)
+                        _set_display(self.query_one("#input-random", Checkbox), not is_dns_scan)
                         if is_dns_scan:
                             self.query_one("#input-random", Checkbox).value = False
                     except Exception:
@@ -1378,8 +1092,8 @@ class DNSScannerTUI(
                     others = [i for i in ("auth-none", "auth-socks5", "auth-ssh") if i != cb_id]
                     for other_id in others:
                         self.query_one(f"#{other_id}", Checkbox).value = False
-                    self.query_one("#socks5-auth-container").display = (cb_id == "auth-socks5")
-                    self.query_one("#ssh-auth-container").display = (cb_id == "auth-ssh")
+                    _set_display(self.query_one("#socks5-auth-container"), (cb_id == "auth-socks5"))
+                    _set_display(self.query_one("#ssh-auth-container"), (cb_id == "auth-ssh"))
                 else:
                     others_on = [i for i in ("auth-none", "auth-socks5", "auth-ssh")
                                  if i != cb_id and self.query_one(f"#{i}", Checkbox).value]
@@ -1464,13 +1178,13 @@ class DNSScannerTUI(
 
         # Update button visibility with explicit refresh for immediate UI update
         try:
-            pause_btn = self.query_one("#pause-btn", Button)
-            resume_btn = self.query_one("#resume-btn", Button)
-            shuffle_btn = self.query_one("#shuffle-btn", Button)
+            pause_btn = self._btn_pause
+            resume_btn = self._btn_resume
+            shuffle_btn = self._btn_shuffle
             
-            pause_btn.display = False
-            resume_btn.display = True
-            shuffle_btn.display = True
+            _set_display(pause_btn, False)
+            _set_display(resume_btn, True)
+            _set_display(shuffle_btn, True)
             
             # Force immediate refresh to update UI even during heavy load
             pause_btn.refresh()
@@ -1478,10 +1192,8 @@ class DNSScannerTUI(
             shuffle_btn.refresh()
             
             # Refresh parent container to ensure layout updates
-            try:
-                self.query_one("#controls").refresh()
-            except Exception:
-                pass
+            if self._controls is not None:
+                self._controls.refresh()
         except Exception as e:
             logger.debug(f"Could not update button visibility on pause: {e}")
 
@@ -1493,28 +1205,26 @@ class DNSScannerTUI(
         if not self.scan_started or not self.is_paused:
             return
 
-        # If user shuffled IPs, we need to switch to memory mode for remaining scan
-        if self.remaining_ips:
-            self._log("[cyan]Resuming with shuffled IP order...[/cyan]")
-            # The scan loop will handle the shuffled order appropriately
-
         self.is_paused = False
         if self._pause_started_at > 0:
             self._paused_elapsed += time.time() - self._pause_started_at
             self._pause_started_at = 0.0
+        # Start a fresh speed sample so the pause gap isn't averaged in
+        self._speed_last_count = self.current_scanned
+        self._speed_last_mono = time.monotonic()
         self.pause_event.set()
         self._log("[green]▶  Scan resumed[/green]")
         self.notify("Scan resumed", severity="information")
 
         # Update button visibility with explicit refresh for immediate UI update
         try:
-            pause_btn = self.query_one("#pause-btn", Button)
-            resume_btn = self.query_one("#resume-btn", Button)
-            shuffle_btn = self.query_one("#shuffle-btn", Button)
+            pause_btn = self._btn_pause
+            resume_btn = self._btn_resume
+            shuffle_btn = self._btn_shuffle
             
-            pause_btn.display = True
-            resume_btn.display = False
-            shuffle_btn.display = False
+            _set_display(pause_btn, True)
+            _set_display(resume_btn, False)
+            _set_display(shuffle_btn, False)
             
             # Force immediate refresh to update UI even during heavy load
             pause_btn.refresh()
@@ -1522,10 +1232,8 @@ class DNSScannerTUI(
             shuffle_btn.refresh()
             
             # Refresh parent container to ensure layout updates
-            try:
-                self.query_one("#controls").refresh()
-            except Exception:
-                pass
+            if self._controls is not None:
+                self._controls.refresh()
         except Exception as e:
             logger.debug(f"Could not update button visibility on resume: {e}")
 
@@ -1899,22 +1607,22 @@ class DNSScannerTUI(
         # Setup log display AFTER switching to scan screen
         log_widget = self.query_one("#log-display", RichLog)
         log_widget.write("[bold cyan]PYDNS Scanner Log[/bold cyan]")
-        log_widget.write(f"[yellow]Subnet file:[/yellow] {self.subnet_file}")
-        log_widget.write(f"[yellow]Domain:[/yellow] {self.domain}")
+        log_widget.write(_TMPL["subnet"].format(self.subnet_file))
+        log_widget.write(_TMPL["domain"].format(self.domain))
         log_widget.write("[yellow]DNS Types:[/yellow] NS, TXT, RND, DPI, EDNS0, NXD")
-        log_widget.write(f"[yellow]Concurrency:[/yellow] {self.concurrency}")
-        log_widget.write(f"[yellow]Scan Preset:[/yellow] {self.scan_preset}")
+        log_widget.write(_TMPL["concurrency"].format(self.concurrency))
+        log_widget.write(_TMPL["preset"].format(self.scan_preset))
         log_widget.write(
-            f"[yellow]Proxy Test:[/yellow] {'Enabled' if self.test_slipstream else 'Disabled'}"
+            _TMPL["proxy"].format("Enabled" if self.test_slipstream else "Disabled")
         )
-        log_widget.write(f"[yellow]DNS Timeout:[/yellow] {self.dns_timeout}s")
+        log_widget.write(_TMPL["dns_timeout"].format(self.dns_timeout))
         if self.test_slipstream:
-            log_widget.write(f"[yellow]Proxy Timeout:[/yellow] {self.slipstream_timeout}s")
-            log_widget.write(f"[yellow]Proxy Test URL:[/yellow] {self.proxy_test_url}")
+            log_widget.write(_TMPL["proxy_timeout"].format(self.slipstream_timeout))
+            log_widget.write(_TMPL["test_url"].format(self.proxy_test_url))
             if self.proxy_ping_threshold == 0:
                 log_widget.write("[yellow]Minimum Ping to Test:[/yellow] all")
             else:
-                log_widget.write(f"[yellow]Minimum Ping to Test:[/yellow] {self.proxy_ping_threshold}ms")
+                log_widget.write(_TMPL["min_ping"].format(self.proxy_ping_threshold))
         # Log enabled extra tests
         enabled_tests = []
         if self.security_test_enabled:
@@ -1926,7 +1634,7 @@ class DNSScannerTUI(
         if self.isp_info_enabled:
             enabled_tests.append("ISP")
         if enabled_tests:
-            log_widget.write(f"[yellow]Extra Tests:[/yellow] {', '.join(enabled_tests)}")
+            log_widget.write(_TMPL["extra_tests"].format(", ".join(enabled_tests)))
         log_widget.write(
             "[dim]DNS legend:[/dim] "
             "[white]F=Found[/white], [green]P=Pass[/green], [red]X=Fail[/red]"
@@ -1993,18 +1701,18 @@ class DNSScannerTUI(
             self.slipstream_path = str(manager.get_executable_path())
 
         # Continue with scan setup
-        log_widget.write(f"[yellow]Subnet file:[/yellow] {self.subnet_file}")
+        log_widget.write(_TMPL["subnet"].format(self.subnet_file))
         if self.active_protocol == "slipnet":
-            log_widget.write(f"[yellow]SlipNet URL:[/yellow] {self.slipnet_url[:40]}...")
-            log_widget.write(f"[yellow]Domain (from config):[/yellow] {self.domain}")
+            log_widget.write(_TMPL["slipnet_url"].format(self.slipnet_url[:40]))
+            log_widget.write(_TMPL["domain_cfg"].format(self.domain))
         else:
-            log_widget.write(f"[yellow]Domain:[/yellow] {self.domain}")
+            log_widget.write(_TMPL["domain"].format(self.domain))
         log_widget.write("[yellow]DNS Types:[/yellow] NS, TXT, RND, DPI, EDNS0, NXD")
-        log_widget.write(f"[yellow]Concurrency:[/yellow] {self.concurrency}")
-        log_widget.write(f"[yellow]Scan Preset:[/yellow] {self.scan_preset}")
-        log_widget.write(f"[yellow]Proxy Test:[/yellow] Enabled ({protocol_name})")
+        log_widget.write(_TMPL["concurrency"].format(self.concurrency))
+        log_widget.write(_TMPL["preset"].format(self.scan_preset))
+        log_widget.write(_TMPL["proxy_enabled"].format(protocol_name))
         if self.active_protocol == "slipstream":
-            log_widget.write(f"[yellow]Auth Mode:[/yellow] {self.auth_mode}")
+            log_widget.write(_TMPL["auth_mode"].format(self.auth_mode))
         # Log enabled extra tests
         enabled_tests = []
         if self.security_test_enabled:
@@ -2016,7 +1724,7 @@ class DNSScannerTUI(
         if self.isp_info_enabled:
             enabled_tests.append("ISP")
         if enabled_tests:
-            log_widget.write(f"[yellow]Extra Tests:[/yellow] {', '.join(enabled_tests)}")
+            log_widget.write(_TMPL["extra_tests"].format(", ".join(enabled_tests)))
         log_widget.write("[green]Starting scan...[/green]\n")
 
         # Show pause button, hide resume button
@@ -2081,14 +1789,14 @@ class DNSScannerTUI(
                 self.slipstream_path = str(manager.get_executable_path())
 
             # Continue with the scan
-            log_widget.write(f"[yellow]Subnet file:[/yellow] {self.subnet_file}")
+            log_widget.write(_TMPL["subnet"].format(self.subnet_file))
             if self.active_protocol == "slipnet":
-                log_widget.write(f"[yellow]SlipNet URL:[/yellow] {self.slipnet_url[:40]}...")
+                log_widget.write(_TMPL["slipnet_url"].format(self.slipnet_url[:40]))
             else:
-                log_widget.write(f"[yellow]Domain:[/yellow] {self.domain}")
+                log_widget.write(_TMPL["domain"].format(self.domain))
             log_widget.write("[yellow]DNS Types:[/yellow] NS, TXT, RND, DPI, EDNS0, NXD")
-            log_widget.write(f"[yellow]Concurrency:[/yellow] {self.concurrency}")
-            log_widget.write(f"[yellow]Proxy Test:[/yellow] Enabled ({protocol_name})")
+            log_widget.write(_TMPL["concurrency"].format(self.concurrency))
+            log_widget.write(_TMPL["proxy_enabled"].format(protocol_name))
             log_widget.write("[green]Starting scan...[/green]\n")
 
             self.scan_started = True
@@ -2321,13 +2029,12 @@ class DNSScannerTUI(
                 self.debug_mode = False
 
         # Reset state for re-scanning
-        self.found_servers.clear()
-        self.server_times.clear()
-        self.proxy_results.clear()
+        self._results.clear()
         self.current_scanned = 0
-        self.table_needs_rebuild = False
-        self.remaining_ips.clear()
+        self._pending_rows.clear()
+        self._stats_dirty = False
         self.tested_subnets.clear()
+        self._dns_cache.clear()
         self.total_ips_yielded = 0  # Track IPs yielded across all stream instances (survives shuffles)
 
         # Reset extra test state
@@ -2345,6 +2052,10 @@ class DNSScannerTUI(
         self.auto_shuffle_count = 0
         self._passed_count = 0
         self._failed_count = 0
+        self._pending_count = 0
+        self._secure_count = 0
+        self._normal_count = 0
+        self._filtered_count = 0
 
         # Shared HTTP client for extra tests (avoids per-request connection overhead)
         self._http_client = httpx.AsyncClient(
@@ -2368,18 +2079,19 @@ class DNSScannerTUI(
             logger.warning(f"ISP cache build failed: {e}")
             self._log(f"[yellow]ISP cache unavailable: {e}[/yellow]")
 
-        # Initialize shutdown event for graceful cleanup
-        self._shutdown_event = asyncio.Event()
-        self.active_scan_tasks = []
+        # Re-arm the shared shutdown event for this scan
+        self._shutdown_event.clear()
+        shutting_down = self._shutdown_event.is_set
+        self.active_scan_tasks.clear()
 
         # Initialize slipstream parallel testing
-        self.slipstream_semaphore = asyncio.Semaphore(self.slipstream_max_concurrent)
-        self.available_ports = deque(
-            range(
-                self.slipstream_base_port,
-                self.slipstream_base_port + self.slipstream_max_concurrent,
-            )
-        )
+        self._proxy_urls.clear()  # credentials may have changed since last scan
+        self.available_ports = asyncio.Queue(maxsize=self.slipstream_max_concurrent)
+        for port in range(
+            self.slipstream_base_port,
+            self.slipstream_base_port + self.slipstream_max_concurrent,
+        ):
+            self.available_ports.put_nowait(port)
         self.pending_slipstream_tests.clear()
         self.slipstream_tasks.clear()
 
@@ -2390,10 +2102,14 @@ class DNSScannerTUI(
         # Placeholder — real start_time is set just before first IP submission
         self.start_time = time.time()
         self.last_update_time = self.start_time
-        self.last_table_update_time = self.start_time
+        self._ewma_speed = 0.0
+        self._speed_last_count = self.current_scanned
+        self._speed_last_mono = time.monotonic()
+        self._final_elapsed = None
 
-        # Start periodic sort refresh timer (every 3 seconds)
-        self._sort_refresh_timer = self.set_interval(3.0, self._periodic_sort_refresh)
+        # Start the debounced resort loop (rebuilds only when asked)
+        self._resort_event.clear()
+        self._resort_task = asyncio.create_task(self._resort_loop())
 
         # Start periodic stats refresh timer (every 0.5s — smooth speed/scanned display)
         self._stats_refresh_timer = self.set_interval(0.5, self._tick_stats)
@@ -2401,7 +2117,6 @@ class DNSScannerTUI(
         # Notify user about CIDR loading
         self.notify("Reading CIDR file...", severity="information", timeout=3)
         self._log("[cyan]Analyzing CIDR file...[/cyan]")
-        await asyncio.sleep(0)
 
         # Fast count of total IPs (not lines) for accurate progress
         loop = asyncio.get_running_loop()
@@ -2421,7 +2136,6 @@ class DNSScannerTUI(
             self._log(f"[cyan]Found {total_ips:,} IPs in file. {self.scan_preset.title()} scan limited to {effective_total:,} IPs.[/cyan]")
         else:
             self._log(f"[cyan]Found {total_ips:,} total IPs to scan. Starting...[/cyan]")
-        await asyncio.sleep(0)
 
         try:
             stats = self._stats_widget
@@ -2434,67 +2148,78 @@ class DNSScannerTUI(
         except Exception as e:
             logger.debug(f"Could not initialize stats widget: {e}")
 
-        logger.info(f"Starting chunked scan with concurrency {self.concurrency}")
+        logger.info(
+            f"Starting chunked scan with concurrency {self.concurrency} "
+            f"on {type(loop).__module__}.{type(loop).__name__}"
+        )
         self._log("[cyan]Scan mode: Streaming (no pre-loading)[/cyan]")
         self._log(f"[cyan]Concurrency: {self.concurrency} workers[/cyan]")
-        await asyncio.sleep(0)
 
         self._log("[cyan]DNS method: Standard UDP (port 53)[/cyan]")
-        await asyncio.sleep(0)
 
         self.notify("Scanning in real-time...", severity="information", timeout=3)
 
-        # ── Create semaphore (same pattern as original) ──
-        sem = asyncio.Semaphore(self.concurrency)
-
         self._log("[green]Starting memory-efficient streaming scan...[/green]")
-        await asyncio.sleep(0)
 
         # ── Reset start_time NOW so speed metric excludes setup ────────
         self.start_time = time.time()
         self.last_update_time = self.start_time
 
-        # Queue-based scheduler: O(1) per result instead of O(N) asyncio.wait.
-        # Each worker task calls put_nowait when it finishes; the main loop
-        # just reads from the queue — no callback-set juggling.
-        max_outstanding = max(self.concurrency * 2, self.concurrency + 64)
-        result_queue: asyncio.Queue = asyncio.Queue()
-        active_tasks_set: set = set()  # kept only for cancel-on-shutdown
-        in_flight: int = 0
+        # Fixed worker pool: self.concurrency long-lived workers pull IPs from
+        # ip_queue, probe them and hand each verdict straight to
+        # _process_result.  The worker count is the concurrency limit, so
+        # there is no per-IP Task or semaphore, and the bounded queue gives
+        # the producer backpressure.  Queue put/get and the probes' network
+        # I/O are the loop's yield points; no explicit sleep(0) is needed.
+        ip_queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        active_tasks_set = self.active_scan_tasks  # kept only for cancel-on-shutdown
+        workers: list[asyncio.Task] = []
         scan_complete = False
+        log_debug = logger.debug  # bound once; the worker loop runs per IP
+        dns_cache = self._dns_cache
+
+        async def _worker() -> None:
+            """Probe IPs from ip_queue until a ``None`` sentinel arrives."""
+            resolver = self._make_resolver()  # one query at a time per worker
+            while True:
+                ip = await ip_queue.get()
+                try:
+                    if ip is None:
+                        return
+                    await self.pause_event.wait()
+                    # IPs re-streamed after a reshuffle reuse their verdict
+                    # instead of waiting out another DNS timeout.
+                    cached = dns_cache.get(ip)
+                    if cached is not None:
+                        dns_cache.move_to_end(ip)
+                        is_valid, response_time = cached
+                    else:
+                        try:
+                            is_valid, response_time = await self._test_dns(ip, resolver)
+                            dns_cache[ip] = (is_valid, response_time)
+                            if len(dns_cache) > DNS_CACHE_MAX:
+                                dns_cache.popitem(last=False)
+                        except Exception as e:
+                            log_debug(f"DNS test error for {ip}: {e}")
+                            is_valid, response_time = False, 0.0
+                    try:
+                        await self._process_result(ip, is_valid, response_time)
+                    except Exception as e:
+                        log_debug(f"Result processing error for {ip}: {e}")
+                finally:
+                    ip_queue.task_done()
 
-        async def _run_test(ip: str) -> None:
-            """Run one DNS probe and push the result tuple to result_queue."""
-            await self.pause_event.wait()
-            try:
-                result = await self._test_dns(ip, sem)
-            except Exception as e:
-                logger.debug(f"DNS test error for {ip}: {e}")
-                result = (ip, False, 0.0)
-            result_queue.put_nowait(result)
-
-        async def _drain_results() -> None:
-            """Process all results already in the queue without blocking."""
-            nonlocal in_flight
-            while not result_queue.empty():
-                r = result_queue.get_nowait()
-                in_flight -= 1
-                await self._process_result(r)
-
-        async def _wait_one() -> None:
-            """Block until exactly one result arrives, then process it."""
-            nonlocal in_flight
-            r = await result_queue.get()
-            in_flight -= 1
-            await self._process_result(r)
-
-        # Disable GC during the hot scan loop to avoid stop-the-world pauses.
-        # We manually collect at natural idle points (shuffle/restart/completion).
-        gc.disable()
+        def _track(task: asyncio.Task) -> asyncio.Task:
+            active_tasks_set.add(task)
+            task.add_done_callback(active_tasks_set.discard)
+            return task
+
+        for _ in range(self.concurrency):
+            workers.append(_track(asyncio.create_task(_worker())))
 
         # Outer loop: restarts streaming when shuffle is signaled
         while not scan_complete:
-            if self._shutdown_event and self._shutdown_event.is_set():
+            if shutting_down():
                 break
 
             # Clear shuffle signal for this iteration
@@ -2508,11 +2233,11 @@ class DNSScannerTUI(
             else:
                 ip_stream = self._stream_ips_from_file()
 
-            # Stream IPs and feed them one-by-one into the task pool.
-            # Backpressure is applied per-IP so progress is smooth & continuous.
+            # Stream IPs into the bounded ip_queue one by one; put() blocks
+            # while the workers are saturated, so progress stays smooth.
             async for ip_chunk in ip_stream:
                 # Check for shutdown
-                if self._shutdown_event and self._shutdown_event.is_set():
+                if shutting_down():
                     break
 
                 # Check for shuffle signal - break to restart stream with new order
@@ -2523,7 +2248,7 @@ class DNSScannerTUI(
 
                 for ip in ip_chunk:
                     # ── Shutdown / shuffle / pause gates ──
-                    if self._shutdown_event and self._shutdown_event.is_set():
+                    if shutting_down():
                         break
                     if self.shuffle_signal.is_set():
                         shuffled = True
@@ -2531,37 +2256,13 @@ class DNSScannerTUI(
                         break
                     await self.pause_event.wait()
 
-                    # Drain any completed results — O(1) per result, no asyncio.wait
-                    await _drain_results()
-
-                    # ── Backpressure: wait until there is room for a new task ──
-                    while in_flight >= max_outstanding:
-                        if self._shutdown_event and self._shutdown_event.is_set():
-                            break
-                        if self.shuffle_signal.is_set():
-                            shuffled = True
-                            self._log("[cyan]Reshuffling IP stream order...[/cyan]")
-                            break
-                        await self.pause_event.wait()
-                        await _wait_one()
-
-                    if shuffled or (self._shutdown_event and self._shutdown_event.is_set()):
-                        break
-
-                    # ── Admit one new task ──
                     self._current_scanning_ip = ip
-                    task = asyncio.create_task(_run_test(ip))
-                    active_tasks_set.add(task)
-                    task.add_done_callback(active_tasks_set.discard)
-                    self.active_scan_tasks = active_tasks_set
-                    in_flight += 1
+                    await ip_queue.put(ip)
 
                 # Break outer stream if shuffle/shutdown detected
-                if shuffled or (self._shutdown_event and self._shutdown_event.is_set()):
+                if shuffled or shutting_down():
                     break
 
-                await _drain_results()
-
             # Check if shuffle was signaled but stream ended before we caught it
             if not shuffled and self.shuffle_signal.is_set():
                 shuffled = True
@@ -2571,73 +2272,42 @@ class DNSScannerTUI(
                 # Stream completed normally (no shuffle interrupt)
                 scan_complete = True
             else:
-                # Shuffle was requested — drain via queue then cancel stragglers
-                if in_flight > 0:
-                    self._log(f"[dim]Draining {in_flight} active tasks before reshuffle...[/dim]")
-                    drain_end = asyncio.get_event_loop().time() + 5.0
-                    while in_flight > 0:
-                        remaining = drain_end - asyncio.get_event_loop().time()
-                        if remaining <= 0:
-                            break
-                        try:
-                            r = await asyncio.wait_for(result_queue.get(), timeout=remaining)
-                            in_flight -= 1
-                            await self._process_result(r)
-                        except asyncio.TimeoutError:
-                            break
-                # Cancel tasks still running after timeout
-                for task in list(active_tasks_set):
-                    task.cancel()
-                active_tasks_set.clear()
-                in_flight = 0
-                self.active_scan_tasks = []
-                # Flush any leftover items pushed by tasks before they saw the cancel
-                while not result_queue.empty():
-                    result_queue.get_nowait()
-
+                # Shuffle was requested — IPs already queued stay queued and
+                # the workers keep probing them while the new stream fills in
+                # behind.  Their /24 blocks were marked tested when the stream
+                # moved past them, so dropping them here would lose them.
                 self._log(
                     f"[cyan]Restarting stream (skipping {len(self.tested_subnets)} completed /24 blocks)[/cyan]"
                 )
-                gc.collect()
-                await asyncio.sleep(0)
 
         # Check if we're shutting down
-        if self._shutdown_event and self._shutdown_event.is_set():
+        if shutting_down():
             self._log("[yellow]Scan interrupted - cleaning up...[/yellow]")
-            gc.enable()
-            gc.collect()
-            if hasattr(self, "_sort_refresh_timer") and self._sort_refresh_timer:
-                self._sort_refresh_timer.stop()
-                self._sort_refresh_timer = None
+            if self._resort_task is not None:
+                self._resort_task.cancel()
+                self._resort_task = None
             if hasattr(self, "_stats_refresh_timer") and self._stats_refresh_timer:
                 self._stats_refresh_timer.stop()
                 self._stats_refresh_timer = None
-            # Cancel remaining tasks
+            # Cancel the workers
             for task in list(active_tasks_set):
                 if not task.done():
                     task.cancel()
-            # Close shared HTTP client on early exit
+            # Close shared HTTP clients on early exit
             try:
                 await self._http_client.aclose()
             except Exception:
                 pass
+            await self._close_proxy_clients()
             self._close_debug_log()
             return
 
-        # Drain all remaining in-flight results from the queue
-        gc.enable()
-        gc.collect()
+        # Let the workers finish the queued IPs, then drain the result queue.
+        # Every probe is bounded by dns_timeout, so the workers always exit.
         self._log("[cyan]Finishing remaining scans...[/cyan]")
-        drain_timeout = max(self.dns_timeout * 2, 10.0)
-        while in_flight > 0:
-            try:
-                r = await asyncio.wait_for(result_queue.get(), timeout=drain_timeout)
-                in_flight -= 1
-                await self._process_result(r)
-            except asyncio.TimeoutError:
-                # Guard against tasks that crashed before enqueuing a result
-                if not active_tasks_set or all(t.done() for t in active_tasks_set):
-                    break
+        for _ in workers:
+            await ip_queue.put(None)
+        await asyncio.gather(*workers, return_exceptions=True)
 
         self._log(
             f"[cyan]Scan complete. Scanned: {self.current_scanned}, Found: {len(self.found_servers)}[/cyan]"
@@ -2646,34 +2316,32 @@ class DNSScannerTUI(
             f"Scan complete. Scanned: {self.current_scanned}, Found: {len(self.found_servers)}"
         )
 
-        # Stop the periodic sort refresh timer
-        if hasattr(self, "_sort_refresh_timer") and self._sort_refresh_timer:
-            self._sort_refresh_timer.stop()
-            self._sort_refresh_timer = None
+        # Stop the resort loop and stats timer
+        if self._resort_task is not None:
+            self._resort_task.cancel()
+            self._resort_task = None
         if hasattr(self, "_stats_refresh_timer") and self._stats_refresh_timer:
             self._stats_refresh_timer.stop()
             self._stats_refresh_timer = None
 
         # Rebuild table at end to show final sorted results
-        self.table_needs_rebuild = True
         self._rebuild_table()
 
-        # Full garbage collection after scan completes
-        gc.collect()
-
-        # Update final statistics
+        # Update final statistics, and freeze elapsed/speed for the
+        # _tick_stats repaints that late proxy results still trigger
+        elapsed = max(0.0, time.time() - self.start_time - self._paused_elapsed)
+        self._final_elapsed = elapsed
+        self._ewma_speed = self.current_scanned / elapsed if elapsed > 0 else 0.0
         try:
             stats = self._stats_widget
             if stats is not None:
-                active_paused = self._paused_elapsed
-                elapsed = max(0.0, time.time() - self.start_time - active_paused)
                 stats.update_stats(
                     scanned=self.current_scanned,
                     found=len(self.found_servers),
                     passed=self._passed_count,
                     failed=self._failed_count,
                     elapsed=elapsed,
-                    speed=self.current_scanned / elapsed if elapsed > 0 else 0,
+                    speed=self._ewma_speed,
                     total=self.current_scanned,  # Set total to actual scanned count
                     bar_progress=float(self.current_scanned),
                     bar_total=float(self.current_scanned),  # Force 100%
@@ -2682,7 +2350,6 @@ class DNSScannerTUI(
             logger.debug(f"Could not update final statistics: {e}")
 
         # Final table rebuild
-        self.table_needs_rebuild = True
         self._rebuild_table()
 
         # Wait for extra test tasks FIRST — they determine which DNS to skip
@@ -2698,13 +2365,12 @@ class DNSScannerTUI(
                 )
             except asyncio.TimeoutError:
                 self._log("[yellow]Timeout waiting for extra tests[/yellow]")
-            self.table_needs_rebuild = True
             self._rebuild_table()
 
         # Wait for all pending proxy tests to complete
-        if self.test_slipstream and self.slipstream_tasks:
+        if self.test_slipstream and (self.slipstream_tasks or self.pending_slipstream_tests):
             proto_name = getattr(self, "active_protocol", "slipstream")
-            num_tasks = len(self.slipstream_tasks)
+            num_tasks = len(self.slipstream_tasks) + len(self.pending_slipstream_tests)
             # Scale timeout: each test can take up to proxy_timeout + overhead,
             # limited by semaphore concurrency.  Multiply by retry count so
             # the wait is long enough for all retries to finish.
@@ -2719,25 +2385,24 @@ class DNSScannerTUI(
             )
             try:
                 await asyncio.wait_for(
-                    asyncio.gather(*self.slipstream_tasks, return_exceptions=True),
-                    timeout=dynamic_timeout,
+                    self._wait_slipstream_tests(), timeout=dynamic_timeout
                 )
             except asyncio.TimeoutError:
                 self._log(
                     f"[yellow]Timeout waiting for {proto_name} tests[/yellow]"
                 )
+            self.pending_slipstream_tests.clear()
             # Mark any remaining Pending/Testing as Skip so counts add up
-            for ip in list(self.proxy_results):
-                if self.proxy_results[ip] in ("Pending", "Testing"):
-                    self.proxy_results[ip] = "Skip"
-                    self._failed_count += 1
-            self.table_needs_rebuild = True
+            if self._pending_count:
+                for ip, row in self._results.items():
+                    if row.proxy in ("Pending", "Testing"):
+                        self._set_proxy_status(ip, "Skip")
+                        self._failed_count += 1
+                        self._update_table_row(ip)
             self._rebuild_table()  # Rebuild after all tests complete
-            # Collect garbage after proxy tests complete
-            gc.collect()
 
         # Auto-save results
-        self._auto_save_results()
+        await self._auto_save_results()
 
         # Revert OS MTU if we changed it
         self._revert_os_mtu()
@@ -2747,210 +2412,160 @@ class DNSScannerTUI(
 
         self.notify("Scan complete! Results auto-saved.", severity="information")
 
-        # Close shared HTTP client
+        # Close shared HTTP clients
         try:
             await self._http_client.aclose()
         except Exception:
             pass
+        await self._close_proxy_clients()
 
-    async def _test_dns_with_callback(
-        self, ip: str, sem: asyncio.Semaphore
-    ) -> tuple[str, bool, float]:
-        """Test DNS and return result tuple."""
-        # Wait if paused
-        await self.pause_event.wait()
-        return await self._test_dns(ip, sem)
-
-    async def _process_result(self, result: tuple[str, bool, float]) -> None:
+    async def _process_result(
+        self, ip: str, is_valid: bool, response_time: float
+    ) -> None:
         """Process a single DNS test result."""
         # Block result processing while paused so UI appears frozen
         await self.pause_event.wait()
-        if isinstance(result, tuple):
-            ip, is_valid, response_time = result
+        # Update scanned count (no longer tracking tested_ips for memory efficiency)
+        self.current_scanned += 1
 
-            # Update scanned count (no longer tracking tested_ips for memory efficiency)
-            self.current_scanned += 1
+        if is_valid:
+            # Reset auto-shuffle counter when DNS found
+            self.ips_since_last_found = 0
 
-            # Periodic garbage collection to prevent memory buildup
-            # (GC is disabled during the hot scan loop for performance)
-            if self.current_scanned % 500 == 0:
-                gc.collect()
+            # Add to found servers and table immediately; a re-found IP
+            # (e.g. rescanned after a shuffle) only refreshes its ping.
+            if self._add_result(ip, response_time):
+                self._on_dns_found(ip, response_time)
+        else:
+            # Increment counter for auto-shuffle logic
+            self.ips_since_last_found += 1
 
-            if is_valid:
-                # Reset auto-shuffle counter when DNS found
-                self.ips_since_last_found = 0
+            # Auto-shuffle logic for presets - instant, no pause needed
+            if (
+                self.preset_auto_shuffle
+                and self.preset_shuffle_threshold > 0
+                and self.ips_since_last_found >= self.preset_shuffle_threshold
+                and not self.is_paused
+            ):
+                # For fast preset: also check proxy pass if proxy test is on
+                should_shuffle = True
+                if self.scan_preset == "fast" and self.test_slipstream:
+                    if self._passed_count > self.auto_shuffle_count:
+                        should_shuffle = False
 
-                # Add to found servers and table immediately
-                self._add_result(ip, response_time)
-                self._log(
-                    f"[green]✓ Found DNS: {ip} ({response_time*1000:.0f}ms)[/green]"
-                )
-                self._debug_log(f"DNS_FOUND ip={ip} ping_ms={response_time*1000:.2f}")
-                ping = f'{response_time*1000:.0f}'
+                # For full preset: skip shuffle if ANY DNS was found in this cycle
+                if self.scan_preset == "full" and len(self.found_servers) > self.auto_shuffle_count:
+                    should_shuffle = False
+                    self.auto_shuffle_count = len(self.found_servers)
+
+                if should_shuffle:
+                    self.auto_shuffle_count += 1
+                    self.ips_since_last_found = 0
+                    self._log(
+                        f"[yellow]Auto-shuffle ({self.scan_preset}): "
+                        f"No DNS in {self.preset_shuffle_threshold} IPs[/yellow]"
+                    )
+                    # Signal instant reshuffle - no pause needed
+                    if self.shuffle_signal:
+                        self.shuffle_signal.set()
+
+        # Check preset max IPs limit (fast and deep) - outside if/else so it always fires
+        if (
+            self.preset_max_ips > 0
+            and self.current_scanned >= self.preset_max_ips
+        ):
+            self._log(
+                f"[yellow]{self.scan_preset.title()} scan limit reached ({self.preset_max_ips} IPs). Stopping.[/yellow]"
+            )
+            self._shutdown_event.set()
 
-                # Queue slipstream test if enabled (non-blocking)
-                should_test_proxy = (
-                    self.proxy_ping_threshold == 0
-                    or int(ping) <= self.proxy_ping_threshold
-                )
-                if self.test_slipstream and should_test_proxy:
-                    # Dedup: skip if already pending/testing/done for this IP
-                    if ip in self.proxy_results and self.proxy_results[ip] in ("Pending", "Testing", "Pass", "Fail"):
-                        self._debug_log(f"PROXY_TEST_SKIP_DUPLICATE ip={ip} status={self.proxy_results[ip]}")
-                    else:
-                        self.proxy_results[ip] = "Pending"
-                        self._debug_log(f"PROXY_TEST_QUEUED ip={ip} ping_ms={ping}")
-                        task = asyncio.create_task(self._queue_slipstream_test(ip))
-                        self.slipstream_tasks.add(task)
-                        task.add_done_callback(self.slipstream_tasks.discard)
-
-                # Queue extra tests if enabled (non-blocking)
-                self._queue_extra_tests(ip)
+        # Stats are repainted by the _flush_ui timer (0.1s interval)
+        self._stats_dirty = True
+
+    def _on_dns_found(self, ip: str, response_time: float) -> None:
+        """Log a newly found DNS server and queue its proxy and extra tests."""
+        self._log(
+            f"[green]✓ Found DNS: {ip} ({response_time*1000:.0f}ms)[/green]"
+        )
+        self._debug_log(f"DNS_FOUND ip={ip} ping_ms={response_time*1000:.2f}")
+        ping = f'{response_time*1000:.0f}'
+
+        # Queue slipstream test if enabled (non-blocking)
+        should_test_proxy = (
+            self.proxy_ping_threshold == 0
+            or int(ping) <= self.proxy_ping_threshold
+        )
+        if self.test_slipstream and should_test_proxy:
+            # Dedup: skip if already pending/testing/done for this IP
+            proxy_status = self._proxy_status(ip)
+            if proxy_status in ("Pending", "Testing", "Pass", "Fail"):
+                self._debug_log(f"PROXY_TEST_SKIP_DUPLICATE ip={ip} status={proxy_status}")
             else:
-                # Increment counter for auto-shuffle logic
-                self.ips_since_last_found += 1
-
-                # Auto-shuffle logic for presets - instant, no pause needed
-                if (
-                    self.preset_auto_shuffle
-                    and self.preset_shuffle_threshold > 0
-                    and self.ips_since_last_found >= self.preset_shuffle_threshold
-                    and not self.is_paused
-                ):
-                    # For fast preset: also check proxy pass if proxy test is on
-                    should_shuffle = True
-                    if self.scan_preset == "fast" and self.test_slipstream:
-                        if self._passed_count > self.auto_shuffle_count:
-                            should_shuffle = False
-
-                    # For full preset: skip shuffle if ANY DNS was found in this cycle
-                    if self.scan_preset == "full" and len(self.found_servers) > self.auto_shuffle_count:
-                        should_shuffle = False
-                        self.auto_shuffle_count = len(self.found_servers)
-
-                    if should_shuffle:
-                        self.auto_shuffle_count += 1
-                        self.ips_since_last_found = 0
-                        self._log(
-                            f"[yellow]Auto-shuffle ({self.scan_preset}): "
-                            f"No DNS in {self.preset_shuffle_threshold} IPs[/yellow]"
-                        )
-                        # Signal instant reshuffle - no pause needed
-                        if self.shuffle_signal:
-                            self.shuffle_signal.set()
+                self._set_proxy_status(ip, "Pending")
+                self._debug_log(f"PROXY_TEST_QUEUED ip={ip} ping_ms={ping}")
+                self._schedule_slipstream_test(ip)
 
-            # Check preset max IPs limit (fast and deep) - outside if/else so it always fires
-            if (
-                self.preset_max_ips > 0
-                and self.current_scanned >= self.preset_max_ips
-            ):
-                self._log(
-                    f"[yellow]{self.scan_preset.title()} scan limit reached ({self.preset_max_ips} IPs). Stopping.[/yellow]"
-                )
-                if self._shutdown_event:
-                    self._shutdown_event.set()
-
-            # Stats updates are handled by the _tick_stats timer (0.5s interval)
-            # Also do inline updates every 10 IPs or 0.1s for immediate feedback
-            current_time = time.time()
-            should_update = (
-                self.current_scanned % 10 == 0 or
-                (current_time - self.last_update_time) >= 0.1
-            )
-            if should_update:
-                active_paused = self._paused_elapsed
-                elapsed = max(0.0, current_time - self.start_time - active_paused)
-                self.last_update_time = current_time
-                try:
-                    secure_cnt, normal_cnt, filtered_cnt = self._get_security_summary_counts()
-                    stats = self._stats_widget
-                    if stats is not None:
-                        stats.update_stats(
-                            scanned=self.current_scanned,
-                            elapsed=elapsed,
-                            speed=self.current_scanned / elapsed if elapsed > 0 else 0,
-                            found=len(self.found_servers),
-                            passed=self._passed_count,
-                            failed=self._failed_count,
-                            secure=secure_cnt,
-                            normal=normal_cnt,
-                            filtered=filtered_cnt,
-                            current_ip=self._current_scanning_ip,
-                            current_range=self._current_scanning_range,
-                            bar_progress=float(self.current_scanned),
-                            bar_total=float(stats.total),
-                        )
-                except Exception as e:
-                    logger.debug(f"Could not update stats during scan: {e}")
+        # Queue extra tests if enabled (non-blocking)
+        self._queue_extra_tests(ip)
 
-            # Yield to UI event loop after each result
-            await asyncio.sleep(0)
+    def _make_resolver(self) -> dns.asyncresolver.Resolver:
+        """Build an unconfigured resolver with the scan's DNS timeout."""
+        resolver = dns.asyncresolver.Resolver(configure=False)
+        resolver.timeout = self.dns_timeout
+        resolver.lifetime = self.dns_timeout
+        return resolver
 
     async def _test_dns(
-        self, ip: str, sem: asyncio.Semaphore
-    ) -> tuple[str, bool, float]:
-        """Test if IP is a DNS server using dnspython (inline async)."""
-        async with sem:
-            try:
-                domain = self.domain
-                if self.random_subdomain:
-                    prefix = random.randbytes(4).hex()
-                    domain = f"{prefix}.{domain}"
+        self, ip: str, resolver: dns.asyncresolver.Resolver | None = None
+    ) -> tuple[bool, float]:
+        """Test if IP is a DNS server; return ``(alive, response_time)``.
 
-                resolver = dns.asyncresolver.Resolver(configure=False)
-                resolver.nameservers = [ip]
-                resolver.timeout = self.dns_timeout
-                resolver.lifetime = self.dns_timeout
+        Concurrency is bounded by the scan's fixed worker pool.  Each worker
+        passes its own *resolver*, which is reused with only the nameserver
+        swapped per probe; without one a fresh resolver is built.
+        """
+        try:
+            domain = self.domain
+            if self.random_subdomain:
+                prefix = random.randbytes(4).hex()
+                domain = f"{prefix}.{domain}"
 
-                start = time.time()
-                try:
-                    await resolver.resolve(domain, self.dns_type)
-                    # Any return (including empty answer) means the server responded.
-                    # Do NOT re-check elapsed here: dnspython already enforced
-                    # resolver.lifetime internally.  Re-checking wall-clock time
-                    # causes false-negatives at high concurrency because event-loop
-                    # scheduling delays inflate the measured elapsed beyond the
-                    # configured timeout even though the network round-trip was fine.
-                    elapsed = time.time() - start
-                    return (ip, True, elapsed)
-                except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
-                    # Server responded with a DNS error — it IS a DNS server.
-                    elapsed = time.time() - start
-                    return (ip, True, elapsed)
-                except dns.resolver.NoNameservers as e:
-                    # Server sent FORMERR / NOTIMP / SERVFAIL — still alive.
-                    elapsed = time.time() - start
-                    errors = getattr(e, "errors", None) or []
-                    if any(len(x) > 4 and x[4] is not None for x in errors):
-                        return (ip, True, elapsed)
-                    return (ip, False, 0.0)
-                except (dns.exception.Timeout, asyncio.TimeoutError):
-                    return (ip, False, 0.0)
-
-            except Exception as exc:
-                logger.debug(f"Unexpected error testing DNS {ip}: {exc}")
-                return (ip, False, 0.0)
+            if resolver is None:
+                resolver = self._make_resolver()
+            resolver.nameservers = [ip]
+
+            start = time.time()
+            try:
+                await resolver.resolve(domain, self.dns_type)
+                # Any return (including empty answer) means the server responded.
+                # Do NOT re-check elapsed here: dnspython already enforced
+                # resolver.lifetime internally.  Re-checking wall-clock time
+                # causes false-negatives at high concurrency because event-loop
+                # scheduling delays inflate the measured elapsed beyond the
+                # configured timeout even though the network round-trip was fine.
+                elapsed = time.time() - start
+                return True, elapsed
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+                # Server responded with a DNS error — it IS a DNS server.
+                elapsed = time.time() - start
+                return True, elapsed
+            except dns.resolver.NoNameservers as e:
+                # Server sent FORMERR / NOTIMP / SERVFAIL — still alive.
+                elapsed = time.time() - start
+                errors = getattr(e, "errors", None) or []
+                if any(len(x) > 4 and x[4] is not None for x in errors):
+                    return True, elapsed
+                return False, 0.0
+            except (dns.exception.Timeout, asyncio.TimeoutError):
+                return False, 0.0
+
+        except Exception as exc:
+            logger.debug(f"Unexpected error testing DNS {ip}: {exc}")
+            return False, 0.0
 
     def _get_security_summary_counts(self) -> tuple[int, int, int]:
         """Return (secure, normal, filtered) counts from security test results."""
-        secure = 0
-        normal = 0
-        filtered = 0
-
-        try:
-            for sec in self.security_results.values():
-                if not isinstance(sec, dict):
-                    continue
-                if sec.get("filtered"):
-                    filtered += 1
-                elif sec.get("dnssec") and not sec.get("hijacked"):
-                    secure += 1
-                else:
-                    normal += 1
-        except Exception:
-            pass
-
-        return secure, normal, filtered
+        return self._secure_count, self._normal_count, self._filtered_count
 
     def _tick_stats(self) -> None:
         """Periodic stats refresh for smooth speed/scanned display."""
@@ -2960,8 +2575,22 @@ class DNSScannerTUI(
         if self.is_paused:
             return
         try:
-            active_paused = self._paused_elapsed
-            elapsed = max(0.0, time.time() - self.start_time - active_paused)
+            elapsed = self._final_elapsed
+            if elapsed is None:
+                elapsed = max(0.0, time.time() - self.start_time - self._paused_elapsed)
+            # Fold a new speed sample in at most once per second; the
+            # 100 ms flush timer also lands here and would only add noise.
+            # Once the sweep is over the final average speed stays put.
+            now = time.monotonic()
+            dt = now - self._speed_last_mono
+            if self._final_elapsed is None and dt >= 1.0:
+                inst = (self.current_scanned - self._speed_last_count) / dt
+                if self._ewma_speed > 0:
+                    self._ewma_speed = 0.7 * self._ewma_speed + 0.3 * inst
+                else:
+                    self._ewma_speed = inst
+                self._speed_last_count = self.current_scanned
+                self._speed_last_mono = now
             secure_cnt, normal_cnt, filtered_cnt = self._get_security_summary_counts()
             stats = self._stats_widget
             if stats is not None:
@@ -2969,7 +2598,7 @@ class DNSScannerTUI(
                 stats.update_stats(
                     scanned=self.current_scanned,
                     elapsed=elapsed,
-                    speed=self.current_scanned / elapsed if elapsed > 0 else 0,
+                    speed=self._ewma_speed,
                     found=len(self.found_servers),
                     passed=self._passed_count,
                     failed=self._failed_count,
@@ -2984,23 +2613,49 @@ class DNSScannerTUI(
         except Exception:
             pass
 
-    def _periodic_sort_refresh(self) -> None:
-        """Periodic full table rebuild for sorted display."""
-        try:
-            if hasattr(self, "found_servers") and self.found_servers:
-                self.table_needs_rebuild = True
-                self._rebuild_table()
-        except Exception:
-            pass
+    def _flush_ui(self) -> None:
+        """Drain queued rows and log lines, and repaint stats if anything changed."""
+        if not self._pending_rows and not self._stats_dirty and not self._log_buffer:
+            return
+        self._drain_logs()
+        self._flush_pending_rows()
+        if self._stats_dirty:
+            self._stats_dirty = False
+            self._tick_stats()
 
     def _log(self, message: str) -> None:
-        """Add message to log display."""
-        try:
-            log_widget = self.query_one("#log-display", RichLog)
-            log_widget.write(message)
-        except Exception as e:
-            # Widget might not be ready or mounted yet - this is expected during startup
-            logger.debug(f"Log widget not available: {e}")
+        """Queue a message for the log display (written by _drain_logs)."""
+        buf = self._log_buffer
+        buf.append(message)
+        if len(buf) > LOG_BUFFER_MAX:
+            overflow = len(buf) - LOG_BUFFER_MAX
+            del buf[:overflow]
+            self._log_dropped += overflow
+
+    def _drain_logs(self) -> None:
+        """Write all queued log lines to the log display.
+
+        Each line is written on its own so a malformed markup tag only
+        affects that line instead of the whole batch.
+        """
+        if not self._log_buffer:
+            return
+        lines = self._log_buffer
+        self._log_buffer = []
+        if self._log_dropped:
+            lines.insert(0, f"[dim]… {self._log_dropped} log lines dropped[/dim]")
+            self._log_dropped = 0
+        log_widget = self._log_widget
+        if log_widget is None:
+            # Widget not mounted yet - this is expected during startup
+            logger.debug("Log widget not available")
+            return
+        write = log_widget.write
+        for line in lines:
+            try:
+                write(line)
+            except Exception as e:
+                logger.debug(f"Could not write to log widget: {e}")
 
     def _debug_log(self, message: str) -> None:
         """Write a timestamped line to the debug log file when debug_mode is on."""
@@ -3029,70 +2684,61 @@ class DNSScannerTUI(
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle double-click on DNS row to copy IP and show extra details."""
-        try:
-            table = event.data_table
-            row_key = event.row_key
-
-            # Check if row_key exists in table
-            if row_key not in table._row_locations:
-                return
+        table = event.data_table
+        row_key = event.row_key
 
-            row = table.get_row(row_key)
-
-            if row and len(row) > 0:
-                ip_index = 1 if self.test_slipstream else 0
-                if len(row) <= ip_index:
-                    return
+        # Check if row_key exists in table
+        if row_key not in table._row_locations:
+            return
 
-                # Extract IP - remove any Rich markup
-                ip_raw = str(row[ip_index])
-                # Strip Rich tags if present
-                ip = re.sub(r"\[.*?\]", "", ip_raw).strip()
+        # Rows are added with key=ip, so the key is the plain IP
+        ip = row_key.value
 
-                if ip:
-                    copied = _copy_to_clipboard(ip)
-                    if copied:
-                        self.notify(f"{ip} copied!", severity="information", timeout=2)
-                    else:
-                        self.notify("Clipboard unavailable on this system", severity="warning", timeout=2)
-
-                    # Show extra test details in log if available
-                    details: list[str] = []
-                    sec = self.security_results.get(ip)
-                    if sec:
-                        details.append(
-                            f"  Security: DNSSEC={'Yes' if sec.get('dnssec') else 'No'}, "
-                            f"Hijack={'Yes' if sec.get('hijacked') else 'No'}, "
-                            f"OpenResolver={'Yes' if sec.get('open_resolver') else 'No'}"
-                        )
-                    proto = self.protocol_results.get(ip, {})
-                    if proto:
-                        proto_items = [
-                            f"{k}={'Yes' if v else 'No'}" for k, v in proto.items()
-                        ]
-                        details.append(f"  Protocols: {', '.join(proto_items)}")
-                    isp = self.isp_results.get(ip)
-                    if isp and isp.get("org"):
-                        details.append(
-                            f"  ISP: {isp.get('org', '')} | AS: {isp.get('asn', '')} | "
-                            f"Country: {isp.get('country', '')}"
-                        )
-                    if details:
-                        self._log(f"[cyan]── Details for {ip} ──[/cyan]")
-                        for line in details:
-                            self._log(f"[dim]{line}[/dim]")
-        except Exception as e:
-            logger.debug(f"Row selection error: {e}")
+        if ip:
+            copied = _copy_to_clipboard(ip)
+            if copied:
+                self.notify(f"{ip} copied!", severity="information", timeout=2)
+            else:
+                self.notify("Clipboard unavailable on this system", severity="warning", timeout=2)
+
+            # Show extra test details in log if available
+            details: list[str] = []
+            sec = self.security_results.get(ip)
+            if sec:
+                details.append(
+                    f"  Security: DNSSEC={'Yes' if sec.get('dnssec') else 'No'}, "
+                    f"Hijack={'Yes' if sec.get('hijacked') else 'No'}, "
+                    f"OpenResolver={'Yes' if sec.get('open_resolver') else 'No'}"
+                )
+            proto = self.protocol_results.get(ip, {})
+            if proto:
+                proto_items = [
+                    f"{k}={'Yes' if v else 'No'}" for k, v in proto.items()
+                ]
+                details.append(f"  Protocols: {', '.join(proto_items)}")
+            isp = self.isp_results.get(ip)
+            if isp and isp.get("org"):
+                details.append(
+                    f"  ISP: {isp.get('org', '')} | AS: {isp.get('asn', '')} | "
+                    f"Country: {isp.get('country', '')}"
+                )
+            if details:
+                self._log(f"[cyan]── Details for {ip} ──[/cyan]")
+                for line in details:
+                    self._log(f"[dim]{line}[/dim]")
 
 def main():
     """Main entry point."""
     try:
-        Path("logs").mkdir(exist_ok=True)
-        Path("results").mkdir(exist_ok=True)
+        for d in ("logs", "results"):
+            os.makedirs(d, exist_ok=True)
 
         logger.info("PYDNS Scanner TUI starting")
 
         app = DNSScannerTUI()
+        # Move import-time and app objects out of the collector's view so
+        # full collections during a scan only walk scan-time allocations.
+        gc.freeze()
         app.run()
 
     except KeyboardInterrupt:
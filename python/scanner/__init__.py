@@ -21,7 +21,7 @@ from .slipnet import SlipNetManager
 from .config_mixin import ConfigMixin
 from .proxy_testing import ProxyTestingMixin
 from .extra_tests import ExtraTestsMixin
-from .results import ResultsMixin
+from .results import ResultRow, ResultsMixin
 from .isp_cache import ISPCacheMixin
 from .ip_streaming import IPStreamingMixin
 
@@ -37,6 +37,7 @@ __all__ = [
     "StatsWidget",
     "VersionedFooter",
     # Standalone classes
+    "ResultRow",
     "SlipstreamManager",
     "SlipNetManager",
     # Mixins
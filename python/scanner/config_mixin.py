@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
+import os
 
-from .constants import logger
+from .constants import _json_dumps, _json_loads, logger
 
 
 class ConfigMixin:
@@ -14,25 +13,33 @@ class ConfigMixin:
     # Attributes expected on *self* (set by DNSScannerTUI.__init__):
     #   config_dir: Path
     #   config_file: Path
+    #   _config_cache: dict — parsed config, read once by _load_config_once()
 
-    def _load_config(self) -> dict:
+    def _load_config_once(self) -> None:
         try:
             if self.config_file.exists():
-                with open(self.config_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
-        except (json.JSONDecodeError, KeyError) as e:
+                self._config_cache = _json_loads(self.config_file.read_bytes())
+        except (ValueError, KeyError) as e:
             logger.debug(f"Config file corrupted or invalid, ignoring: {e}")
         except (OSError, IOError) as e:
             logger.debug(f"Failed to read config file: {e}")
         except Exception as e:
             logger.warning(f"Unexpected error loading config: {e}")
-        return {}
+
+    def _load_config(self) -> dict:
+        return dict(self._config_cache)
 
     def _save_config(self, config: dict) -> None:
+        # Nothing changed since the last load/save — skip the rewrite.
+        if config == self._config_cache:
+            return
+        tmp_file = self.config_file.with_suffix(".json.tmp")
         try:
             self.config_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=2)
+            # Write-then-rename so an interrupted save never truncates the config.
+            tmp_file.write_bytes(_json_dumps(config, indent=True))
+            os.replace(tmp_file, self.config_file)
+            self._config_cache = dict(config)
         except (OSError, IOError) as e:
             logger.debug(f"Failed to save config (permission/IO error): {e}")
         except Exception as e:
@@ -1,4 +1,4 @@
-"""Platform detection, logging setup, regex constants and event-loop policy."""
+"""Platform detection, logging setup, regex/JSON engines and event-loop policy."""
 
 from __future__ import annotations
 
@@ -33,6 +33,27 @@ try:
 except ImportError:
     import re
 
+# ---------------------------------------------------------------------------
+# JSON engine (orjson when available, stdlib json otherwise)
+# ---------------------------------------------------------------------------
+try:
+    import orjson as _orjson
+
+    def _json_loads(data: bytes | str):
+        return _orjson.loads(data)
+
+    def _json_dumps(obj, *, indent: bool = False) -> bytes:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    import json as _json
+
+    def _json_loads(data: bytes | str):  # type: ignore[misc]
+        return _json.loads(data)
+
+    def _json_dumps(obj, *, indent: bool = False) -> bytes:  # type: ignore[misc]
+        return _json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
 # ---------------------------------------------------------------------------
 # Clipboard helper
 # ---------------------------------------------------------------------------
@@ -64,12 +85,21 @@ except ImportError:
 
 
 # ---------------------------------------------------------------------------
-# Windows event-loop policy (must run before any asyncio call)
+# Event-loop policy (must run before any asyncio call)
 # ---------------------------------------------------------------------------
 # Textual's main event loop expects SelectorEventLoop on Windows.
 # DNS scanning runs inline in this same loop using dnspython's async resolver.
-if sys.platform == "win32" and sys.version_info < (3, 14):
-    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+# Elsewhere, uvloop (optional) lowers per-callback overhead for that loop.
+if sys.platform == "win32":
+    if sys.version_info < (3, 14):
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+elif not _ANDROID:
+    try:
+        import uvloop  # type: ignore[import-not-found]
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
 
 # ---------------------------------------------------------------------------
 # Logging configuration
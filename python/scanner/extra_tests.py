@@ -41,6 +41,7 @@ class ExtraTestsMixin:
     Expected attributes on *self*:
         extra_test_semaphore, security_test_enabled, ipv6_test_enabled,
         edns0_test_enabled, isp_info_enabled, security_results,
+        _secure_count, _normal_count, _filtered_count,
         protocol_results, isp_results, resolve_results, tcp_udp_results,
         extra_test_tasks, domain, dns_type, _isp_cache_path
     """
@@ -91,9 +92,9 @@ class ExtraTestsMixin:
                 # security_results for display only; do NOT skip proxy based on this.
                 resolved = self.resolve_results.get(dns_ip, "-")
                 if resolved != "-" and self._is_bogon_ip(resolved.split(",")[0].strip()):
-                    self.security_results[dns_ip] = {
+                    self._set_security_result(dns_ip, {
                         "dnssec": False, "hijacked": False, "filtered": True,
-                    }
+                    })
                     self._log(
                         f"[yellow]⚠ {dns_ip}: Resolved to bogon {resolved} "
                         f"→ Filtered[/yellow]"
@@ -107,16 +108,17 @@ class ExtraTestsMixin:
                 dns_types = self.dns_types_results.get(dns_ip, {})
                 dns_score = sum(1 for v in dns_types.values() if v)
                 if dns_types and dns_score < min_score:
-                    if self.test_slipstream and self.proxy_results.get(dns_ip) in (
+                    if self.test_slipstream and self._proxy_status(dns_ip) in (
                         "Pending", "Testing", "N/A",
                     ):
-                        self.proxy_results[dns_ip] = "Skip"
+                        self._set_proxy_status(dns_ip, "Skip")
                         self._log(
                             f"[yellow]⚠ {dns_ip}: DNS type score {dns_score}/6 < {min_score} "
                             f"→ skipping proxy test[/yellow]"
                         )
 
                 self._update_table_row(dns_ip)
+                self._request_resort()
 
         task = asyncio.create_task(_run_extras(ip))
         self.extra_test_tasks.add(task)
@@ -124,6 +126,22 @@ class ExtraTestsMixin:
 
     # ── Security tests ──────────────────────────────────────────────────
 
+    def _set_security_result(self, ip: str, result: dict) -> None:
+        """Store *ip*'s security verdict and move it between the summary tallies."""
+        old = self.security_results.get(ip)
+        if old is not None:
+            self._tally_security(old, -1)
+        self.security_results[ip] = result
+        self._tally_security(result, 1)
+
+    def _tally_security(self, sec: dict, delta: int) -> None:
+        if sec.get("filtered"):
+            self._filtered_count += delta
+        elif sec.get("dnssec") and not sec.get("hijacked"):
+            self._secure_count += delta
+        else:
+            self._normal_count += delta
+
     async def _test_security(self, ip: str) -> None:
         result: dict = {"dnssec": False, "hijacked": False, "filtered": False}
         try:
@@ -137,7 +155,7 @@ class ExtraTestsMixin:
                     or (first == 192 and second == 168)
                 ):
                     result["filtered"] = True
-                    self.security_results[ip] = result
+                    self._set_security_result(ip, result)
                     return
 
             nxdomain_test = f"nxdomain-{random.randbytes(6).hex()}.example.invalid"
@@ -168,7 +186,7 @@ class ExtraTestsMixin:
         except Exception as e:
             logger.debug(f"Security test error for {ip}: {e}")
 
-        self.security_results[ip] = result
+        self._set_security_result(ip, result)
         if result["dnssec"]:
             self._log(f"[cyan]\U0001f512 {ip}: DNSSEC supported[/cyan]")
         if result["hijacked"]:
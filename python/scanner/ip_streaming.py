@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import ipaddress
 import mmap
+import os
 import random
 import socket
 import struct
@@ -17,30 +18,62 @@ class IPStreamingMixin:
     """Mixin for streaming IPs from CIDR files.
 
     Expected attributes on *self*:
-        subnet_file, _shutdown_event, shuffle_signal, tested_subnets,
-        total_ips_yielded, preset_max_ips, concurrency, scan_strategy
+        subnet_file, _subnet_cache, _shutdown_event, shuffle_signal,
+        tested_subnets, total_ips_yielded, preset_max_ips, concurrency, scan_strategy
     """
 
+    @staticmethod
+    def _cidr_host_count(line: str) -> int:
+        """Host count for an ``a.b.c.d[/prefix]`` line, computed from the prefix.
+
+        Raises ``ValueError`` for anything else (e.g. netmask notation) so
+        the caller can fall back to ``ipaddress``.
+        """
+        addr, _, prefix = line.partition("/")
+        if prefix:
+            if not prefix.isdigit() or int(prefix) > 32:
+                raise ValueError(line)
+            prefixlen = int(prefix)
+        else:
+            prefixlen = 32
+        octets = addr.split(".")
+        if len(octets) != 4 or not all(
+            o.isdigit() and int(o) <= 255 and (o[0] != "0" or o == "0") for o in octets
+        ):
+            raise ValueError(line)
+        return (1 << (32 - prefixlen)) - (2 if prefixlen < 31 else 0)
+
     def _count_total_ips_fast(self, filepath: str) -> int:
-        """Fast counting of total IPs in CIDR file without loading into memory."""
+        """Fast counting of total IPs in CIDR file.
+
+        The file is read in one call and split into lines in C; CIDR lists
+        are small next to the address space they describe.
+        """
         total_ips = 0
+        host_count = self._cidr_host_count
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        try:
-                            network = ipaddress.IPv4Network(line, strict=False)
-                            if network.prefixlen >= 31:
-                                total_ips += network.num_addresses
-                            else:
-                                total_ips += network.num_addresses - 2
-                        except (
-                            ipaddress.AddressValueError,
-                            ipaddress.NetmaskValueError,
-                            ValueError,
-                        ):
-                            logger.debug(f"Skipping invalid CIDR line: {line[:50]}")
+            with open(filepath, "rb") as f:
+                text = f.read().decode("utf-8", errors="ignore")
+            for line in text.splitlines():
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    try:
+                        total_ips += host_count(line)
+                        continue
+                    except ValueError:
+                        pass
+                    try:
+                        network = ipaddress.IPv4Network(line, strict=False)
+                        if network.prefixlen >= 31:
+                            total_ips += network.num_addresses
+                        else:
+                            total_ips += network.num_addresses - 2
+                    except (
+                        ipaddress.AddressValueError,
+                        ipaddress.NetmaskValueError,
+                        ValueError,
+                    ):
+                        logger.debug(f"Skipping invalid CIDR line: {line[:50]}")
         except (OSError, IOError) as e:
             logger.error(f"Failed to read CIDR file '{filepath}': {e}")
             return 0
@@ -96,80 +129,76 @@ class IPStreamingMixin:
         logger.info(f"Loaded {len(subnets)} subnets")
         return subnets
 
+    @staticmethod
+    def _blocks_24(net: ipaddress.IPv4Network) -> list[tuple[int, int]]:
+        """Split *net* into ``(start, prefixlen)`` blocks no wider than /24.
+
+        Works on integers, so a /16 yields 256 tuples rather than 256
+        ``IPv4Network`` objects.
+        """
+        base = int(net.network_address)
+        if net.prefixlen >= 24:
+            return [(base, net.prefixlen)]
+        return [(base + (k << 8), 24) for k in range(1 << (24 - net.prefixlen))]
+
+    async def _get_subnets(self) -> list[ipaddress.IPv4Network]:
+        """Return a fresh copy of subnet_file's networks, parsing it only when it changed.
+
+        The streamers restart on every reshuffle; caching the parse keyed on
+        path, mtime and size keeps those restarts from re-reading the file.
+        """
+        path = self.subnet_file
+        try:
+            st = os.stat(path)
+            key = (path, st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = None
+        cached = self._subnet_cache
+        if key is not None and cached is not None and cached[0] == key:
+            return list(cached[1])
+        loop = asyncio.get_running_loop()
+        subnets = await loop.run_in_executor(None, self._load_subnets)
+        self._subnet_cache = (key, subnets) if key is not None else None
+        return list(subnets)
+
     async def _stream_ips_from_file(self) -> AsyncGenerator[list[str], None]:
         """Stream IPs from CIDR file using mmap for zero-copy reads."""
         chunk: list[str] = []
         chunk_size = max(4, min(16, self.concurrency // 4 if self.concurrency > 0 else 8))
         max_ips = self.preset_max_ips
         rng = random.Random()
-        loop = asyncio.get_running_loop()
+        # /24 keys whose IPs are in the current chunk; marked tested only once
+        # the consumer comes back for more, so an abandoned stream re-offers them.
+        pending_keys: list[int] = []
 
-        def read_and_process():
-            subnets = []
-            try:
-                with open(self.subnet_file, "r+b") as f:
-                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
-                        for raw in iter(mm.readline, b""):
-                            line_str = raw.decode("utf-8", errors="ignore").strip()
-                            if line_str and not line_str.startswith("#"):
-                                try:
-                                    subnets.append(
-                                        ipaddress.IPv4Network(line_str, strict=False)
-                                    )
-                                except (
-                                    ipaddress.AddressValueError,
-                                    ipaddress.NetmaskValueError,
-                                    ValueError,
-                                ):
-                                    pass
-            except (OSError, mmap.error) as e:
-                logger.warning(f"mmap read failed for '{self.subnet_file}': {e}, falling back")
-                try:
-                    with open(self.subnet_file, "r", encoding="utf-8") as f:
-                        for line in f:
-                            line = line.strip()
-                            if line and not line.startswith("#"):
-                                try:
-                                    subnets.append(
-                                        ipaddress.IPv4Network(line, strict=False)
-                                    )
-                                except (ValueError,):
-                                    pass
-                except (OSError, IOError) as e2:
-                    logger.error(f"Failed to read subnet file: {e2}")
-            return subnets
-
-        subnets = await loop.run_in_executor(None, read_and_process)
+        subnets = await self._get_subnets()
         rng.shuffle(subnets)
 
         _pack = struct.pack
         _ntoa = socket.inet_ntoa
+        blocks_24 = self._blocks_24
 
         for net in subnets:
-            if self._shutdown_event and self._shutdown_event.is_set():
+            if self._shutdown_event.is_set():
                 break
 
-            if net.prefixlen >= 24:
-                chunks_24 = [net]
-            else:
-                chunks_24 = list(net.subnets(new_prefix=24))
+            chunks_24 = blocks_24(net)
             rng.shuffle(chunks_24)
 
-            for subnet_chunk in chunks_24:
-                subnet_key = int(subnet_chunk.network_address)
+            for subnet_key, prefixlen in chunks_24:
                 if subnet_key in self.tested_subnets:
                     continue
 
                 if hasattr(self, "_current_scanning_range"):
-                    self._current_scanning_range = str(subnet_chunk)
+                    self._current_scanning_range = f"{_ntoa(_pack('>I', subnet_key))}/{prefixlen}"
 
                 net_int = subnet_key
-                num_addr = subnet_chunk.num_addresses
+                num_addr = 1 << (32 - prefixlen)
 
                 if num_addr == 1:
                     chunk.append(_ntoa(_pack(">I", net_int)))
                     self.total_ips_yielded += 1
-                elif subnet_chunk.prefixlen >= 31:
+                elif prefixlen >= 31:
                     indices = list(range(num_addr))
                     rng.shuffle(indices)
                     for idx in indices:
@@ -186,94 +215,46 @@ class IPStreamingMixin:
                         if max_ips > 0 and self.total_ips_yielded >= max_ips:
                             break
 
-                if not hasattr(self, '_pending_subnet_keys'):
-                    self._pending_subnet_keys: list[int] = []
-                self._pending_subnet_keys.append(subnet_key)
+                pending_keys.append(subnet_key)
 
                 if len(chunk) >= chunk_size:
                     yield chunk
-                    for sk in self._pending_subnet_keys:
-                        self.tested_subnets.add(sk)
-                    self._pending_subnet_keys.clear()
+                    self.tested_subnets.update(pending_keys)
+                    pending_keys.clear()
                     chunk = []
-                    await asyncio.sleep(0)
 
                 if max_ips > 0 and self.total_ips_yielded >= max_ips:
                     if chunk:
                         yield chunk
-                        for sk in self._pending_subnet_keys:
-                            self.tested_subnets.add(sk)
-                        self._pending_subnet_keys.clear()
+                        self.tested_subnets.update(pending_keys)
+                        pending_keys.clear()
                     return
 
             if max_ips > 0 and self.total_ips_yielded >= max_ips:
                 if chunk:
                     yield chunk
-                    for sk in self._pending_subnet_keys:
-                        self.tested_subnets.add(sk)
-                    self._pending_subnet_keys.clear()
+                    self.tested_subnets.update(pending_keys)
+                    pending_keys.clear()
                 return
 
         if chunk:
             yield chunk
-            for sk in getattr(self, '_pending_subnet_keys', []):
-                self.tested_subnets.add(sk)
-            if hasattr(self, '_pending_subnet_keys'):
-                self._pending_subnet_keys.clear()
+            self.tested_subnets.update(pending_keys)
 
     async def _stream_ips_redis_style(self) -> AsyncGenerator[list[str], None]:
         """Stream IPs using Redis-style pincer (dual-direction) strategy."""
         chunk_size = max(4, min(16, self.concurrency // 4 if self.concurrency > 0 else 8))
         max_ips = self.preset_max_ips
         rng = random.Random()
-        loop = asyncio.get_running_loop()
 
-        def read_subnets():
-            subnets = []
-            try:
-                with open(self.subnet_file, "r+b") as f:
-                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
-                        for raw in iter(mm.readline, b""):
-                            line_str = raw.decode("utf-8", errors="ignore").strip()
-                            if line_str and not line_str.startswith("#"):
-                                try:
-                                    subnets.append(
-                                        ipaddress.IPv4Network(line_str, strict=False)
-                                    )
-                                except (
-                                    ipaddress.AddressValueError,
-                                    ipaddress.NetmaskValueError,
-                                    ValueError,
-                                ):
-                                    pass
-            except (OSError, mmap.error) as e:
-                logger.warning(f"mmap read failed: {e}, falling back")
-                try:
-                    with open(self.subnet_file, "r", encoding="utf-8") as f:
-                        for line in f:
-                            line = line.strip()
-                            if line and not line.startswith("#"):
-                                try:
-                                    subnets.append(
-                                        ipaddress.IPv4Network(line, strict=False)
-                                    )
-                                except (ValueError,):
-                                    pass
-                except (OSError, IOError) as e2:
-                    logger.error(f"Failed to read subnet file: {e2}")
-            return subnets
-
-        subnets = await loop.run_in_executor(None, read_subnets)
-
-        all_blocks: list[ipaddress.IPv4Network] = []
+        subnets = await self._get_subnets()
+
+        tested = self.tested_subnets
+        all_blocks: list[tuple[int, int]] = []
         for net in subnets:
-            if net.prefixlen >= 24:
-                blocks = [net]
-            else:
-                blocks = list(net.subnets(new_prefix=24))
-            for blk in blocks:
-                if int(blk.network_address) not in self.tested_subnets:
-                    all_blocks.append(blk)
+            all_blocks.extend(
+                blk for blk in self._blocks_24(net) if blk[0] not in tested
+            )
 
         if not all_blocks:
             return
@@ -287,7 +268,7 @@ class IPStreamingMixin:
             f"across {len(all_blocks)} /24 blocks[/cyan]"
         )
 
-        lanes: list[list[ipaddress.IPv4Network]] = [[] for _ in range(num_lanes)]
+        lanes: list[list[tuple[int, int]]] = [[] for _ in range(num_lanes)]
         for idx, blk in enumerate(all_blocks):
             lanes[idx % num_lanes].append(blk)
 
@@ -296,12 +277,13 @@ class IPStreamingMixin:
 
         positions = [0] * len(lanes)
         batch: list[str] = []
+        pending_keys: list[int] = []  # see _stream_ips_from_file
         _pack = struct.pack
         _ntoa = socket.inet_ntoa
-        _sample = random.sample
+        _sample = rng.sample
 
         while True:
-            if self._shutdown_event and self._shutdown_event.is_set():
+            if self._shutdown_event.is_set():
                 break
             if self.shuffle_signal and self.shuffle_signal.is_set():
                 break
@@ -314,24 +296,23 @@ class IPStreamingMixin:
                     continue
 
                 any_remaining = True
-                subnet_chunk = lane_blocks[pos]
+                subnet_key, prefixlen = lane_blocks[pos]
                 positions[lane_idx] = pos + 1
 
-                subnet_key = int(subnet_chunk.network_address)
                 if subnet_key in self.tested_subnets:
                     continue
 
                 # Track current range for stats widget (no object alloc needed)
                 if hasattr(self, "_current_scanning_range"):
-                    self._current_scanning_range = str(subnet_chunk)
+                    self._current_scanning_range = f"{_ntoa(_pack('>I', subnet_key))}/{prefixlen}"
 
                 net_int = subnet_key
-                num_addr = subnet_chunk.num_addresses
+                num_addr = 1 << (32 - prefixlen)
 
                 if num_addr == 1:
                     batch.append(_ntoa(_pack(">I", net_int)))
                     self.total_ips_yielded += 1
-                elif subnet_chunk.prefixlen >= 31:
+                elif prefixlen >= 31:
                     indices = list(range(num_addr))
                     rng.shuffle(indices)
                     for idx in indices:
@@ -348,24 +329,19 @@ class IPStreamingMixin:
                         if max_ips > 0 and self.total_ips_yielded >= max_ips:
                             break
 
-                if not hasattr(self, '_pending_redis_keys'):
-                    self._pending_redis_keys: list[int] = []
-                self._pending_redis_keys.append(subnet_key)
+                pending_keys.append(subnet_key)
 
                 if len(batch) >= chunk_size:
                     yield batch
-                    for sk in self._pending_redis_keys:
-                        self.tested_subnets.add(sk)
-                    self._pending_redis_keys.clear()
+                    self.tested_subnets.update(pending_keys)
+                    pending_keys.clear()
                     batch = []
-                    await asyncio.sleep(0)
 
                 if max_ips > 0 and self.total_ips_yielded >= max_ips:
                     if batch:
                         yield batch
-                        for sk in self._pending_redis_keys:
-                            self.tested_subnets.add(sk)
-                        self._pending_redis_keys.clear()
+                        self.tested_subnets.update(pending_keys)
+                        pending_keys.clear()
                     return
 
             if not any_remaining:
@@ -373,34 +349,4 @@ class IPStreamingMixin:
 
         if batch:
             yield batch
-            for sk in getattr(self, '_pending_redis_keys', []):
-                self.tested_subnets.add(sk)
-            if hasattr(self, '_pending_redis_keys'):
-                self._pending_redis_keys.clear()
-
-    def _collect_ips(self, subnets: list[ipaddress.IPv4Network]) -> list[str]:
-        """Collect all IPs from subnets in random order."""
-        logger.info(f"Collecting IPs from {len(subnets)} subnets")
-        all_ips: list[str] = []
-        rng = random.Random()
-
-        subnets_copy = list(subnets)
-        rng.shuffle(subnets_copy)
-
-        for net in subnets_copy:
-            if net.prefixlen >= 24:
-                chunks = [net]
-            else:
-                chunks = list(net.subnets(new_prefix=24))
-            rng.shuffle(chunks)
-
-            for chunk in chunks:
-                if chunk.num_addresses == 1:
-                    all_ips.append(str(chunk.network_address))
-                else:
-                    ips = list(chunk.hosts())
-                    rng.shuffle(ips)
-                    all_ips.extend([str(ip) for ip in ips])
-
-        logger.info(f"Collected {len(all_ips)} IPs to scan")
-        return all_ips
+            self.tested_subnets.update(pending_keys)
@@ -8,10 +8,9 @@ A JSON cache file is still loaded as a supplementary source if it exists.
 from __future__ import annotations
 
 import ipaddress
-import json
 from pathlib import Path
 
-from .constants import logger
+from .constants import _json_loads, logger
 
 # ---------------------------------------------------------------------------
 # Built-in Iranian ISP CIDR → name mapping
@@ -272,8 +271,7 @@ class ISPCacheMixin:
         try:
             cache_path = getattr(self, "_isp_cache_path", None)
             if cache_path and Path(str(cache_path)).exists():
-                with open(cache_path, "r", encoding="utf-8") as f:
-                    cache_data = json.load(f)
+                cache_data = _json_loads(Path(str(cache_path)).read_bytes())
                 for entry in cache_data.get("entries", []):
                     cidr = entry.get("cidr", "")
                     org = entry.get("org", "")
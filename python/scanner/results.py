@@ -2,67 +2,169 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import csv
+import io
+import os
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
+from typing import Iterable, Iterator
+
+from textual.widgets.data_table import CellDoesNotExist
 
 from .constants import logger
 from .utils import _format_time
 
+# Minimum gap between two sort-order rebuilds of the results table.
+RESORT_DEBOUNCE_S = 2.0
+
+# Proxy status ("Success|<ms>" is keyed by its "Success" prefix) -> sort
+# rank, table markup and CSV text.  Testing / Pending / N/A use the defaults.
+_PROXY_RANK = {"Success": 0, "Failed": 1, "Skip": 2}
+_PROXY_RANK_DEFAULT = 3
+_PROXY_MARKUP = {"Failed": "[red]\\[x][/red]", "Skip": "[dim grey]\\[s][/dim grey]"}
+_PROXY_MARKUP_DEFAULT = "[blue]\\[\u25cf][/blue]"
+_PROXY_CSV = {"Failed": "[x]", "Skip": "[s]"}
+_PROXY_CSV_DEFAULT = "[\u25cf]"
+
+
+def _csv_payload(headers: list[str], rows: Iterable[list[str]]) -> bytes:
+    """Render *headers* and *rows* as one UTF-8 encoded CSV document.
+
+    Rows are encoded chunk by chunk into a byte buffer, so a large save never
+    holds the whole document as ``str`` and ``bytes`` at the same time.
+    """
+    buf = io.BytesIO()
+    text = io.TextIOWrapper(buf, encoding="utf-8", newline="")
+    csv.writer(text).writerows(chain((headers,), rows))
+    text.detach()  # flushes, leaves buf open
+    return buf.getvalue()
+
+
+def _write_csv(path: Path, payload: bytes) -> None:
+    """Write the encoded CSV *payload* to *path* in a single write.
+
+    Blocking; callers run it via ``asyncio.to_thread`` so the UI loop keeps
+    repainting.  Write-then-rename so a crash or full disk mid-save never
+    leaves a truncated CSV under the final name.
+    """
+    tmp_path = path.with_suffix(".csv.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+class ResultRow:
+    """Per-server scan state: DNS response time and proxy test status."""
+
+    __slots__ = ("time", "proxy")
+
+    def __init__(self, time: float, proxy: str = "N/A") -> None:
+        self.time = time
+        self.proxy = proxy  # "N/A", "Pending", "Testing", "Success|<ms>", "Failed", "Skip"
+
 
 class ResultsMixin:
     """Mixin for results table operations and CSV export.
 
     Expected attributes on *self*:
-        found_servers, server_times, proxy_results, security_results,
+        _results (ip -> ResultRow), _passed_count, _failed_count,
+        _pending_count, security_results,
         protocol_results, isp_results, resolve_results, tcp_udp_results,
         test_slipstream, security_test_enabled, ipv6_test_enabled,
-        edns0_test_enabled, isp_info_enabled, table_needs_rebuild
+        edns0_test_enabled, isp_info_enabled,
+        _pending_rows, _row_order, _results_table, _resort_event,
+        _results_dir
     """
 
-    def _add_result(self, ip: str, response_time: float) -> None:
-        self.found_servers.add(ip)
-        self.server_times[ip] = response_time
+    @property
+    def found_servers(self):
+        """Live view of every found server IP."""
+        return self._results.keys()
 
-        try:
-            time_str = _format_time(response_time)
+    def _proxy_status(self, ip: str, default: str = "N/A") -> str:
+        row = self._results.get(ip)
+        return row.proxy if row is not None else default
 
-            row = []
-            if self.test_slipstream:
-                row.append(self._get_proxy_str(ip))
-            row.extend([ip, time_str])
-            row.extend([
-                self._get_ipver_column(ip),
-                self._get_security_column(ip),
-                self._get_tcp_udp_column(ip),
-                self._get_dns_types_column(ip),
-                self._get_edns0_column(ip),
-                self._get_resolve_column(ip),
-                self._get_isp_column(ip),
-            ])
-
-            from textual.widgets import DataTable
-            table = self.query_one("#results-table", DataTable)
-            table.add_row(*row, key=ip)
+    def _set_proxy_status(self, ip: str, status: str) -> None:
+        """Set *ip*'s proxy status and move it between the running tallies."""
+        row = self._results.get(ip)
+        if row is None or row.proxy == status:
+            return
+        self._tally_proxy_status(row.proxy, -1)
+        row.proxy = status
+        self._tally_proxy_status(status, 1)
+
+    def _tally_proxy_status(self, status: str, delta: int) -> None:
+        if status.startswith("Success"):
+            self._passed_count += delta
+        elif status == "Failed":
+            self._failed_count += delta
+        elif status in ("Pending", "Testing"):
+            self._pending_count += delta
+
+    def _add_result(self, ip: str, response_time: float) -> bool:
+        """Record a found server; return False if *ip* was already known."""
+        prev = self._results.get(ip)
+        if prev is not None:
+            prev.time = response_time
+            return False
+        self._results[ip] = ResultRow(response_time)
+        # Rows are appended in batches by _flush_pending_rows().
+        self._pending_rows.append(ip)
+        return True
+
+    def _build_row(self, ip: str) -> list[str]:
+        row = []
+        if self.test_slipstream:
+            row.append(self._get_proxy_str(ip))
+        row.extend([ip, _format_time(self._results[ip].time)])
+        row.extend([
+            self._get_ipver_column(ip),
+            self._get_security_column(ip),
+            self._get_tcp_udp_column(ip),
+            self._get_dns_types_column(ip),
+            self._get_edns0_column(ip),
+            self._get_resolve_column(ip),
+            self._get_isp_column(ip),
+        ])
+        return row
+
+    def _flush_pending_rows(self) -> None:
+        """Append all rows queued by _add_result in one batched update."""
+        if not self._pending_rows:
+            return
+        pending = self._pending_rows
+        self._pending_rows = []
+        table = self._results_table
+        if table is None:
+            return
+        # DataTable can only append, so order each batch the way
+        # _rebuild_table ranks fresh rows (nothing tested yet): by ping.
+        results = self._results
+        pending.sort(key=lambda ip: results[ip].time)
+        try:
+            with self.batch_update():
+                for ip in pending:
+                    if ip not in table._row_locations:
+                        table.add_row(*self._build_row(ip), key=ip)
+                        self._row_order.append(ip)
         except Exception as e:
-            logger.debug(f"Could not add result row to table: {e}")
+            logger.debug(f"Could not add result rows to table: {e}")
+        # New rows only know their place within this batch.
+        self._request_resort()
 
     # ── Column formatters ───────────────────────────────────────────────
 
     def _get_proxy_str(self, ip: str) -> str:
-        proxy_status = self.proxy_results.get(ip, "N/A")
-        if proxy_status.startswith("Success"):
-            if "|" in proxy_status:
-                latency = proxy_status.split("|", 1)[1]
+        kind, _, latency = self._proxy_status(ip).partition("|")
+        if kind == "Success":
+            if latency:
                 return f"[green]\\[\u2713] {latency}[/green]"
             return "[green]\\[\u2713][/green]"
-        elif proxy_status == "Failed":
-            return "[red]\\[x][/red]"
-        elif proxy_status in ("Testing", "Pending", "N/A"):
-            return "[blue]\\[\u25cf][/blue]"
-        elif proxy_status == "Skip":
-            return "[dim grey]\\[s][/dim grey]"
-        return "[blue]\\[\u25cf][/blue]"
+        return _PROXY_MARKUP.get(kind, _PROXY_MARKUP_DEFAULT)
 
     def _get_ipver_column(self, ip: str) -> str:
         proto = self.protocol_results.get(ip, {})
@@ -144,41 +246,40 @@ class ResultsMixin:
     # ── Table operations ────────────────────────────────────────────────
 
     def _update_table_row(self, ip: str) -> None:
-        try:
-            from textual.widgets import DataTable
-            table = self.query_one("#results-table", DataTable)
-            if ip in table._row_locations:
-                if self.test_slipstream:
-                    table.update_cell(ip, "proxy", self._get_proxy_str(ip))
-                table.update_cell(ip, "ipver", self._get_ipver_column(ip))
-                table.update_cell(ip, "isp", self._get_isp_column(ip))
-                table.update_cell(ip, "security", self._get_security_column(ip))
-                table.update_cell(ip, "tcpudp", self._get_tcp_udp_column(ip))
-                table.update_cell(ip, "resolved", self._get_resolve_column(ip))
-                table.update_cell(ip, "dns_types", self._get_dns_types_column(ip))
-                table.update_cell(ip, "edns0", self._get_edns0_column(ip))
-        except Exception as e:
-            logger.debug(f"Could not update table row for {ip}: {e}")
+        table = self._results_table
+        if table is None or ip not in table._row_locations:
+            return
+        # Only a column missing from the current layout is expected here;
+        # anything else is a real bug and should surface.
+        with contextlib.suppress(CellDoesNotExist):
+            if self.test_slipstream:
+                table.update_cell(ip, "proxy", self._get_proxy_str(ip))
+            table.update_cell(ip, "ipver", self._get_ipver_column(ip))
+            table.update_cell(ip, "isp", self._get_isp_column(ip))
+            table.update_cell(ip, "security", self._get_security_column(ip))
+            table.update_cell(ip, "tcpudp", self._get_tcp_udp_column(ip))
+            table.update_cell(ip, "resolved", self._get_resolve_column(ip))
+            table.update_cell(ip, "dns_types", self._get_dns_types_column(ip))
+            table.update_cell(ip, "edns0", self._get_edns0_column(ip))
 
     def _rebuild_table(self) -> None:
-        if not self.table_needs_rebuild:
-            return
         try:
-            ips = list(self.server_times.keys())
-            finalized = [ip for ip in ips if self._is_ip_finalized(ip)]
-            testing = [ip for ip in ips if not self._is_ip_finalized(ip)]
+            results = self._results
+            finalized = []
+            testing = []
+            # Feed the sort the current display order first (then any IPs
+            # not shown yet): between resorts only a few rows move, so
+            # Timsort finds long presorted runs and does close to O(N) work.
+            for ip in dict.fromkeys(chain(self._row_order, results)):
+                if ip in results:
+                    (finalized if self._is_ip_finalized(ip) else testing).append(ip)
 
             def _sort_key(ip):
-                proxy = self.proxy_results.get(ip, "N/A") if self.test_slipstream else ""
+                row = results[ip]
                 if self.test_slipstream:
-                    if proxy.startswith("Success"):
-                        proxy_rank = 0
-                    elif proxy == "Failed":
-                        proxy_rank = 1
-                    elif proxy == "Skip":
-                        proxy_rank = 2
-                    else:  # Testing, Pending, N/A
-                        proxy_rank = 3
+                    proxy_rank = _PROXY_RANK.get(
+                        row.proxy.partition("|")[0], _PROXY_RANK_DEFAULT
+                    )
                 else:
                     proxy_rank = 0
                 dns_score_rank = 6 - sum(
@@ -187,41 +288,42 @@ class ResultsMixin:
                 dnssec_rank = (
                     0 if self.security_results.get(ip, {}).get("dnssec") else 1
                 )
-                return (proxy_rank, dns_score_rank, dnssec_rank, self.server_times.get(ip, 9999.0))
-
-            sorted_final = sorted(finalized, key=_sort_key)
-            sorted_testing = sorted(testing, key=_sort_key)
+                return (proxy_rank, dns_score_rank, dnssec_rank, row.time)
 
-            from textual.widgets import DataTable
-            table = self.query_one("#results-table", DataTable)
-            scroll_x = table.scroll_x
-            scroll_y = table.scroll_y
+            order = sorted(finalized, key=_sort_key)
+            order += sorted(testing, key=_sort_key)
 
-            table.clear(columns=True)
-            for label, key, width in self._get_table_columns():
-                table.add_column(label, key=key, width=width)
-            table.cursor_type = "row"
-
-            for ip in sorted_final + sorted_testing:
-                row = []
-                if self.test_slipstream:
-                    row.append(self._get_proxy_str(ip))
-                row.extend([ip, _format_time(self.server_times[ip])])
-                row.extend([
-                    self._get_ipver_column(ip),
-                    self._get_security_column(ip),
-                    self._get_tcp_udp_column(ip),
-                    self._get_dns_types_column(ip),
-                    self._get_edns0_column(ip),
-                    self._get_resolve_column(ip),
-                    self._get_isp_column(ip),
-                ])
-                table.add_row(*row, key=ip)
-
-            table.scroll_x = scroll_x
-            table.scroll_y = scroll_y
-
-            self.table_needs_rebuild = False
+            table = self._results_table
+            if table is None:
+                return
+            # Cells are kept current by _update_table_row, so when nothing
+            # moved there is no need to clear and re-add every row.
+            if order == self._row_order and not self._pending_rows:
+                return
+            columns = self._get_table_columns()
+            # The rebuild covers every found server, including queued rows.
+            self._pending_rows.clear()
+            if [k.value for k in table.columns] == [key for _, key, _ in columns]:
+                # Rows on screen are current (see _update_table_row): append
+                # the ones not shown yet, then reorder everything in place.
+                located = table._row_locations
+                for ip in order:
+                    if ip not in located:
+                        table.add_row(*self._build_row(ip), key=ip)
+                rank = {ip: i for i, ip in enumerate(order)}
+                table.sort("ip", key=rank.__getitem__)
+            else:
+                scroll_x = table.scroll_x
+                scroll_y = table.scroll_y
+                table.clear(columns=True)
+                for label, key, width in columns:
+                    table.add_column(label, key=key, width=width)
+                table.cursor_type = "row"
+                for ip in order:
+                    table.add_row(*self._build_row(ip), key=ip)
+                table.scroll_x = scroll_x
+                table.scroll_y = scroll_y
+            self._row_order = order
         except Exception as e:
             logger.debug(f"Could not rebuild results table: {e}")
 
@@ -241,22 +343,40 @@ class ResultsMixin:
             return False
         if self.edns0_test_enabled and "edns0" not in proto:
             return False
-        if self.test_slipstream and self.proxy_results.get(ip) in (
+        if self.test_slipstream and self._proxy_status(ip) in (
             "Pending", "Testing"
         ):
             return False
         return True
 
-    def _periodic_sort_refresh(self) -> None:
-        if self.found_servers and not self.is_paused:
-            self.table_needs_rebuild = True
+    def _request_resort(self) -> None:
+        """Wake the resort loop; repeated requests coalesce."""
+        self._resort_event.set()
+
+    async def _resort_loop(self) -> None:
+        """Rebuild the table on request, at most once per RESORT_DEBOUNCE_S.
+
+        Cell contents are kept current by _update_table_row; this loop only
+        moves rows.  The first request is served at once and anything that
+        arrives during the quiet period is folded into the next rebuild.
+        """
+        event = self._resort_event
+        while True:
+            await event.wait()
+            event.clear()
             self._rebuild_table()
+            await asyncio.sleep(RESORT_DEBOUNCE_S)
 
     # ── CSV export ──────────────────────────────────────────────────────
 
     def _build_csv_headers_and_rows(
-        self, servers_to_save: dict
-    ) -> tuple[list[str], list[list[str]]]:
+        self, servers_to_save: Iterable[str]
+    ) -> tuple[list[str], Iterator[list[str]]]:
+        """Return the CSV headers and a lazy iterator over the data rows.
+
+        Rows are produced on demand so the CSV writer consumes them one at
+        a time instead of holding a second list of every saved server.
+        """
         headers = []
         if self.test_slipstream:
             headers.append("Proxy")
@@ -271,18 +391,13 @@ class ResultsMixin:
         headers.append("IP")
         headers.append("ISP")
 
-        def _csv_sort_key(item):
-            ip, t = item
-            proxy = self.proxy_results.get(ip, "N/A") if self.test_slipstream else ""
+        results = self._results
+
+        def _csv_sort_key(ip):
             if self.test_slipstream:
-                if proxy.startswith("Success"):
-                    proxy_rank = 0
-                elif proxy == "Failed":
-                    proxy_rank = 1
-                elif proxy == "Skip":
-                    proxy_rank = 2
-                else:
-                    proxy_rank = 3
+                proxy_rank = _PROXY_RANK.get(
+                    self._proxy_status(ip).partition("|")[0], _PROXY_RANK_DEFAULT
+                )
             else:
                 proxy_rank = 0
             dns_score_rank = 6 - sum(
@@ -291,124 +406,112 @@ class ResultsMixin:
             dnssec_rank = (
                 0 if self.security_results.get(ip, {}).get("dnssec") else 1
             )
-            return (proxy_rank, dns_score_rank, dnssec_rank, t)
+            return (proxy_rank, dns_score_rank, dnssec_rank, results[ip].time)
 
-        sorted_servers = sorted(servers_to_save.items(), key=_csv_sort_key)
-
-        rows: list[list[str]] = []
-        for ip, resp_time in sorted_servers:
-            row = []
-            if self.test_slipstream:
-                raw = self.proxy_results.get(ip, "N/A")
-                if raw.startswith("Success"):
-                    latency = raw.split("|", 1)[1] if "|" in raw else ""
-                    row.append(f"[\u2713] {latency}" if latency else "[\u2713]")
-                elif raw == "Failed":
-                    row.append("[x]")
-                elif raw == "Skip":
-                    row.append("[s]")
-                else:
-                    row.append("[\u25cf]")
-            row.extend([ip, f"{resp_time * 1000:.0f}"])
-            # IPv4/IPv6
-            proto = self.protocol_results.get(ip, {})
-            if proto.get("ipv6"):
-                row.append("v4/v6")
-            elif ip in self.protocol_results:
-                row.append("v4")
-            else:
-                row.append("")
-            # TCP/UDP
-            row.append(self.tcp_udp_results.get(ip, ""))
-            # Security
-            if self.security_test_enabled:
-                sec = self.security_results.get(ip, {})
-                if ip in self.security_results:
-                    if sec.get("filtered"):
-                        row.append("Filtered")
-                    elif sec.get("hijacked"):
-                        row.append("Hijacked")
-                    elif sec.get("dnssec"):
-                        row.append("Secure")
+        def _rows() -> Iterator[list[str]]:
+            for ip in sorted(servers_to_save, key=_csv_sort_key):
+                row = []
+                if self.test_slipstream:
+                    kind, _, latency = self._proxy_status(ip).partition("|")
+                    if kind == "Success":
+                        row.append(f"[\u2713] {latency}" if latency else "[\u2713]")
                     else:
-                        row.append("Normal")
+                        row.append(_PROXY_CSV.get(kind, _PROXY_CSV_DEFAULT))
+                row.extend([ip, f"{results[ip].time * 1000:.0f}"])
+                # IPv4/IPv6
+                proto = self.protocol_results.get(ip, {})
+                if proto.get("ipv6"):
+                    row.append("v4/v6")
+                elif ip in self.protocol_results:
+                    row.append("v4")
                 else:
                     row.append("")
-            # DNS Types
-            dt = self.dns_types_results.get(ip)
-            if dt:
-                labels = ("NS", "TXT", "RND", "DPI", "EDNS0", "NXD")
-                ok = [t for t in labels if dt.get(t)]
-                row.append(f"{','.join(ok)} {len(ok)}/6" if ok else "0/6")
-            else:
-                row.append("")
-            # EDNS0
-            if self.edns0_test_enabled:
-                if ip in self.protocol_results and "edns0" in self.protocol_results[ip]:
-                    if proto.get("edns0"):
-                        payload = proto.get("edns0_payload", 0)
-                        row.append(f"Yes ({payload})" if payload else "Yes")
+                # TCP/UDP
+                row.append(self.tcp_udp_results.get(ip, ""))
+                # Security
+                if self.security_test_enabled:
+                    sec = self.security_results.get(ip, {})
+                    if ip in self.security_results:
+                        if sec.get("filtered"):
+                            row.append("Filtered")
+                        elif sec.get("hijacked"):
+                            row.append("Hijacked")
+                        elif sec.get("dnssec"):
+                            row.append("Secure")
+                        else:
+                            row.append("Normal")
                     else:
-                        row.append("No")
+                        row.append("")
+                # DNS Types
+                dt = self.dns_types_results.get(ip)
+                if dt:
+                    labels = ("NS", "TXT", "RND", "DPI", "EDNS0", "NXD")
+                    ok = [t for t in labels if dt.get(t)]
+                    row.append(f"{','.join(ok)} {len(ok)}/6" if ok else "0/6")
                 else:
                     row.append("")
-            # IP (resolved)
-            row.append(self.resolve_results.get(ip, ""))
-            # ISP
-            isp = self.isp_results.get(ip, {})
-            org = isp.get("org", "") or ""
-            row.append(org if org != "-" else "")
-            rows.append(row)
-        return headers, rows
-
-    def _auto_save_results(self) -> None:
+                # EDNS0
+                if self.edns0_test_enabled:
+                    if ip in self.protocol_results and "edns0" in self.protocol_results[ip]:
+                        if proto.get("edns0"):
+                            payload = proto.get("edns0_payload", 0)
+                            row.append(f"Yes ({payload})" if payload else "Yes")
+                        else:
+                            row.append("No")
+                    else:
+                        row.append("")
+                # IP (resolved)
+                row.append(self.resolve_results.get(ip, ""))
+                # ISP
+                isp = self.isp_results.get(ip, {})
+                org = isp.get("org", "") or ""
+                row.append(org if org != "-" else "")
+                yield row
+
+        return headers, _rows()
+
+    def _iter_servers_to_save(self):
+        """Yield the IP of every server a save should include."""
         if self.test_slipstream:
-            passed_servers = {
-                ip: time
-                for ip, time in self.server_times.items()
-                if self.proxy_results.get(ip, "").startswith("Success")
-            }
-            if not passed_servers:
+            return (
+                ip for ip, row in self._results.items()
+                if row.proxy.startswith("Success")
+            )
+        return iter(self._results)
+
+    async def _auto_save_results(self) -> None:
+        n_found = len(self._results)
+        if self.test_slipstream:
+            passed = self._passed_count
+            if not passed:
                 self._log(
                     "[yellow]No DNS servers passed proxy test - nothing to save.[/yellow]"
                 )
                 self._log(
-                    f"[yellow]Total DNS found: {len(self.found_servers)}, Passed proxy: 0[/yellow]"
+                    f"[yellow]Total DNS found: {n_found}, Passed proxy: 0[/yellow]"
                 )
                 logger.warning(
-                    f"No servers passed proxy test. Total found: {len(self.found_servers)}"
+                    f"No servers passed proxy test. Total found: {n_found}"
                 )
                 return
-            servers_to_save = passed_servers
             self._log(
-                f"[cyan]Saving {len(passed_servers)}/{len(self.found_servers)} "
+                f"[cyan]Saving {passed}/{n_found} "
                 f"DNS servers that passed proxy test...[/cyan]"
             )
-            logger.info(f"Saving {len(passed_servers)} servers that passed proxy test")
-        else:
-            if not self.found_servers:
-                self._log("[yellow]No DNS servers found to save.[/yellow]")
-                return
-            servers_to_save = self.server_times
-
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        output_dir = Path("results")
-
-        try:
-            output_dir.mkdir(exist_ok=True)
-        except (OSError, PermissionError) as e:
-            self._log(f"[red]Failed to create results directory: {e}[/red]")
-            logger.error(f"Failed to create results directory: {e}")
+            logger.info(f"Saving {passed} servers that passed proxy test")
+        elif not n_found:
+            self._log("[yellow]No DNS servers found to save.[/yellow]")
             return
 
-        csv_file = output_dir / f"{timestamp}.csv"
-        headers, rows = self._build_csv_headers_and_rows(servers_to_save)
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        csv_file = self._results_dir / f"{timestamp}.csv"
+        # Render on the loop thread (reads live result dicts); write off it.
+        payload = _csv_payload(
+            *self._build_csv_headers_and_rows(self._iter_servers_to_save())
+        )
 
         try:
-            with open(csv_file, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(headers)
-                writer.writerows(rows)
+            await asyncio.to_thread(_write_csv, csv_file, payload)
             self._log(f"[green]\u2713 Results auto-saved to: {csv_file}[/green]")
             logger.info(f"Results auto-saved to {csv_file}")
         except (OSError, IOError, PermissionError) as e:
@@ -417,41 +520,29 @@ class ResultsMixin:
 
     def action_save_results(self) -> None:
         if self.test_slipstream:
-            passed_servers = {
-                ip: time
-                for ip, time in self.server_times.items()
-                if self.proxy_results.get(ip, "").startswith("Success")
-            }
-            if not passed_servers:
+            saved = self._passed_count
+            if not saved:
                 self.notify("No servers passed proxy test!", severity="warning")
                 return
-            servers_to_save = passed_servers
+        elif not self.found_servers:
+            self.notify("No results to save!", severity="warning")
+            return
         else:
-            if not self.found_servers:
-                self.notify("No results to save!", severity="warning")
-                return
-            servers_to_save = self.server_times
+            saved = len(self._results)
 
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        output_dir = Path("results")
-
-        try:
-            output_dir.mkdir(exist_ok=True)
-        except (OSError, PermissionError) as e:
-            self.notify(f"Failed to create results directory: {e}", severity="error")
-            logger.error(f"Failed to create results directory: {e}")
-            return
-
-        csv_file = output_dir / f"scan_{timestamp}.csv"
-        headers, rows = self._build_csv_headers_and_rows(servers_to_save)
-
+        csv_file = self._results_dir / f"scan_{timestamp}.csv"
+        payload = _csv_payload(
+            *self._build_csv_headers_and_rows(self._iter_servers_to_save())
+        )
+        self.run_worker(self._save_csv(csv_file, payload, saved), group="save")
+
+    async def _save_csv(self, csv_file: Path, payload: bytes, saved: int) -> None:
+        """Write a manual save off the UI thread, then report the outcome."""
         try:
-            with open(csv_file, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(headers)
-                writer.writerows(rows)
+            await asyncio.to_thread(_write_csv, csv_file, payload)
             self.notify(
-                f"Saved {len(rows)} servers: {csv_file.name}",
+                f"Saved {saved} servers: {csv_file.name}",
                 severity="information",
             )
             logger.info(f"Results saved to {csv_file}")
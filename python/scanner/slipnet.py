@@ -4,14 +4,35 @@ from __future__ import annotations
 
 import asyncio
 import base64
-import functools
+import http.client
+import os
 import stat
+import time
+import urllib.error
 from pathlib import Path
 from typing import Optional
 
 import httpx
+from rich.text import Text
 
 from .constants import logger
+from .utils import (
+    _PROGRESS_INTERVAL,
+    _UI_PROGRESS_INTERVAL,
+    _detect_platform,
+    _lookup_platform_key,
+    _ordered_candidates,
+    _stream_to_file,
+)
+
+_EXEC_BITS = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+
+# Fixed download-log lines, styled once so RichLog skips the markup parser.
+_STYLED = {
+    "downloading": Text("Downloading SlipNet...", "cyan"),
+    "chmod": Text("✓ Set executable permissions on SlipNet client", "green"),
+    "no_url": Text("No download URL available for this platform", "red"),
+}
 
 # Pinned to v2.4.1 — update this when a new release is needed.
 _SLIPNET_VERSION = "v2.4.1"
@@ -55,57 +76,46 @@ class SlipNetManager:
         "Android": "android",
     }
 
+    # Ordered, de-duplicated lookup names per platform (alt names first).
+    _CANDIDATES: dict[str, tuple[str, ...]] = _ordered_candidates(FILENAMES, ALT_FILENAMES)
+
     def __init__(self):
-        import platform as _platform
         import sys as _sys
 
         if getattr(_sys, "frozen", False) and hasattr(_sys, "_MEIPASS"):
             self.base_dir = Path(_sys._MEIPASS) / "slipnet-client"
         else:
             self.base_dir = Path(__file__).resolve().parent.parent / "slipnet-client"
-        self.system = self._detect_system()
-        self.machine = _platform.machine()
+        self.system, self.machine = _detect_platform()
         self._cached_executable_path: Optional[Path] = None
 
-        if self.machine in ("x86_64", "AMD64", "i386", "i686", "x86"):
-            self.machine = "x86_64"
-        elif self.machine in ("aarch64", "arm64", "armv8l"):
-            self.machine = "arm64"
-        elif self.machine.startswith("arm"):
-            self.machine = "arm64"
+        # Resolve everything derived from (system, machine) once.
+        self._platform_key: Optional[str] = _lookup_platform_key(self.system, self.machine)
+        self._platform_dir: Path = self.base_dir / self.PLATFORM_DIRS.get(
+            self.system, self.system.lower()
+        )
+        self._download_url: Optional[str] = (
+            self.DOWNLOAD_URLS.get(self._platform_key) if self._platform_key else None
+        )
+        primary = self.FILENAMES.get(self._platform_key) if self._platform_key else None
+        self._primary_path: Optional[Path] = self._platform_dir / primary if primary else None
+        self._candidates: tuple[str, ...] = self._CANDIDATES.get(self._platform_key, ())
+        self._candidate_paths: list[Path] = [
+            self._platform_dir / filename for filename in self._candidates
+        ]
+        self._candidate_names = frozenset(map(os.path.normcase, self._candidates))
+        self._installed_cache: Optional[bool] = None
+        self._installed_checked_at: float = 0.0
 
     # ── Platform helpers ────────────────────────────────────────────────
 
-    @staticmethod
-    def _detect_system() -> str:
-        import os
-        import platform as _platform
-
-        if os.environ.get("ANDROID_ROOT") or os.environ.get("ANDROID_DATA"):
-            return "Android"
-        if os.environ.get("TERMUX_VERSION") or Path("/data/data/com.termux").exists():
-            return "Android"
-        if Path("/system/build.prop").exists():
-            return "Android"
-        return _platform.system()
-
-    @functools.lru_cache(maxsize=1)
     def get_platform_key(self) -> str:
-        if self.system == "Windows":
-            return "Windows"
-        elif self.system == "Android":
-            return "Android"
-        elif self.system == "Linux":
-            return f"Linux-{self.machine}"
-        elif self.system == "Darwin":
-            return f"Darwin-{self.machine}"
-        else:
-            raise RuntimeError(f"Unsupported platform: {self.system}")
+        if self._platform_key is None:
+            raise RuntimeError(f"Unsupported platform: {self.system} {self.machine}")
+        return self._platform_key
 
-    @functools.lru_cache(maxsize=1)
     def get_platform_dir(self) -> Path:
-        dir_name = self.PLATFORM_DIRS.get(self.system, self.system.lower())
-        return self.base_dir / dir_name
+        return self._platform_dir
 
     # ── Executable path / install checks ────────────────────────────────
 
@@ -113,43 +123,56 @@ class SlipNetManager:
         if self._cached_executable_path and self._cached_executable_path.exists():
             return self._cached_executable_path
 
-        platform_key = self.get_platform_key()
-        platform_dir = self.get_platform_dir()
-
-        for filename in self.ALT_FILENAMES.get(platform_key, []):
-            exe_path = platform_dir / filename
+        for exe_path in self._candidate_paths:
             if exe_path.exists():
                 self._cached_executable_path = exe_path
                 return exe_path
 
-        filename = self.FILENAMES.get(platform_key)
-        if not filename:
+        if self._primary_path is None:
             raise RuntimeError(f"Unsupported platform: {self.system} {self.machine}")
-        return platform_dir / filename
+        return self._primary_path
 
     def is_installed(self) -> bool:
-        platform_key = self.get_platform_key()
-        platform_dir = self.get_platform_dir()
-
-        for filename in self.ALT_FILENAMES.get(platform_key, []):
-            if (platform_dir / filename).exists():
-                return True
+        # One directory listing instead of a stat() per candidate; the answer
+        # is reused for a second so polling callers stay syscall-free, and
+        # a finished download resets it.  normcase() folds case on Windows; a miss
+        # still falls back to exists(), which also covers case-insensitive
+        # macOS volumes where normcase() is a no-op.
+        now = time.monotonic()
+        if self._installed_cache is not None and now - self._installed_checked_at < 1.0:
+            return self._installed_cache
+        names = self._candidate_names
+        normcase = os.path.normcase
+        try:
+            with os.scandir(self._platform_dir) as entries:
+                installed = any(normcase(entry.name) in names for entry in entries)
+        except OSError:
+            installed = False
+        if not installed:
+            installed = any(p.exists() for p in self._candidate_paths)
+        self._installed_cache = installed
+        self._installed_checked_at = now
+        return installed
 
-        primary_filename = self.FILENAMES.get(platform_key)
-        if primary_filename and (platform_dir / primary_filename).exists():
-            return True
-        return False
+    @staticmethod
+    def _make_executable(exe_path: Path) -> bool:
+        """Add the exec bits using a single stat(); False if they were already set."""
+        mode = os.stat(exe_path).st_mode
+        if mode & _EXEC_BITS == _EXEC_BITS:
+            return False
+        os.chmod(exe_path, mode | _EXEC_BITS)
+        return True
 
     def ensure_executable(self) -> bool:
         try:
             exe_path = self.get_executable_path()
-            if not exe_path.exists():
-                return False
             if self.system in ("Linux", "Darwin"):
-                current_mode = exe_path.stat().st_mode
-                exe_path.chmod(current_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-                logger.info(f"Set executable permissions on {exe_path}")
-            return True
+                if self._make_executable(exe_path):
+                    logger.info(f"Set executable permissions on {exe_path}")
+                return True
+            return exe_path.exists()
+        except FileNotFoundError:
+            return False
         except Exception as e:
             logger.error(f"Failed to set executable permissions: {e}")
             return False
@@ -177,17 +200,25 @@ class SlipNetManager:
             return (False, "Download failed")
 
     def get_download_url(self) -> Optional[str]:
-        try:
-            platform_key = self.get_platform_key()
-            return self.DOWNLOAD_URLS.get(platform_key)
-        except RuntimeError:
-            return None
-
-    async def download(
-        self, progress_callback=None, max_retries: int = 5, retry_delay: float = 2.0
+        return self._download_url
+
+    async def _download_core(
+        self,
+        on_progress,
+        log,
+        *,
+        max_retries: int,
+        retry_delay: float,
+        interval: float,
     ) -> bool:
+        """Resumable download loop shared by download() and download_with_ui().
+
+        *on_progress(done, total)* receives throttled byte counts and *log*
+        receives styled ``rich.text.Text`` status lines.
+        """
         url = self.get_download_url()
         if not url:
+            log(_STYLED["no_url"])
             return False
 
         exe_path = self.get_executable_path()
@@ -204,186 +235,108 @@ class SlipNetManager:
                 headers = {}
                 if downloaded > 0:
                     headers["Range"] = f"bytes={downloaded}-"
-                    if progress_callback:
-                        progress_callback(
-                            downloaded, 0,
-                            f"Resuming from {downloaded / (1024 * 1024):.1f} MB...",
-                        )
+                    log(Text(f"Resuming from {downloaded / (1024 * 1024):.1f} MB...", "cyan"))
 
-                async with httpx.AsyncClient(
-                    follow_redirects=True,
-                    timeout=httpx.Timeout(30.0, read=60.0, connect=30.0),
-                    verify=True,
-                    limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-                ) as client:
-                    async with client.stream("GET", url, headers=headers) as response:
-                        if response.status_code == 206:
-                            content_range = response.headers.get("content-range", "")
-                            if "/" in content_range:
-                                total = int(content_range.split("/")[1])
-                            else:
-                                total = downloaded + int(
-                                    response.headers.get("content-length", 0)
-                                )
-                            mode = "ab"
-                        elif response.status_code == 200:
-                            total = int(response.headers.get("content-length", 0))
-                            downloaded = 0
-                            mode = "wb"
-                        else:
-                            response.raise_for_status()
-                            continue
-
-                        if progress_callback:
-                            progress_callback(downloaded, total, "Downloading...")
-
-                        with open(temp_path, mode) as f:
-                            async for chunk in response.aiter_bytes(chunk_size=32768):
-                                f.write(chunk)
-                                downloaded += len(chunk)
-                                if progress_callback:
-                                    progress_callback(downloaded, total, "Downloading...")
+                await _stream_to_file(
+                    url, temp_path, headers, downloaded, on_progress, interval=interval
+                )
 
                 if temp_path.exists():
                     if exe_path.exists():
                         exe_path.unlink()
                     temp_path.rename(exe_path)
+                # The binary just appeared; drop any cached "not installed".
+                self._installed_cache = None
 
                 if self.system in ("Linux", "Darwin"):
-                    exe_path.chmod(
-                        exe_path.stat().st_mode
-                        | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
-                    )
-                    logger.info(f"Set executable permissions on {exe_path}")
+                    self._make_executable(exe_path)
+                    log(_STYLED["chmod"])
 
                 return True
 
             except (
                 httpx.TimeoutException, httpx.NetworkError,
                 httpx.HTTPStatusError, httpx.ConnectError,
+                urllib.error.URLError, http.client.HTTPException,
+                TimeoutError, ConnectionError,
             ) as e:
                 error_msg = f"{type(e).__name__}"
                 if hasattr(e, "__cause__") and e.__cause__:
                     error_msg += f": {str(e.__cause__)}"
-                if progress_callback:
-                    progress_callback(downloaded, 0, f"Retry {attempt}/{max_retries}: {error_msg}")
+                log(Text(f"Retry {attempt}/{max_retries}: {error_msg}", "yellow"))
                 if attempt < max_retries:
+                    log(Text(f"Waiting {retry_delay * attempt:.0f}s before retry...", "dim"))
                     await asyncio.sleep(retry_delay * attempt)
                     continue
                 else:
                     return False
             except Exception as e:
                 logger.error(f"Unexpected download error: {e}", exc_info=True)
+                log(Text(f"Unexpected error: {type(e).__name__}: {e}", "red"))
                 if temp_path.exists():
                     temp_path.unlink()
                 return False
 
         return False
 
+    async def download(
+        self, progress_callback=None, max_retries: int = 5, retry_delay: float = 2.0
+    ) -> bool:
+        last_done = 0
+
+        def on_progress(done: int, total: int) -> None:
+            nonlocal last_done
+            last_done = done
+            if progress_callback:
+                progress_callback(done, total, "Downloading...")
+
+        def log(text: Text) -> None:
+            logger.info(text.plain)
+            if progress_callback:
+                progress_callback(last_done, 0, text.plain)
+
+        return await self._download_core(
+            on_progress,
+            log,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            interval=_PROGRESS_INTERVAL,
+        )
+
     async def download_with_ui(
         self, progress_bar, log_widget, max_retries: int = 5, retry_delay: float = 2.0
     ) -> bool:
-        url = self.get_download_url()
-        if not url:
-            log_widget.write("[red]No download URL available for this platform[/red]")
-            return False
-
-        exe_path = self.get_executable_path()
-        temp_path = exe_path.with_suffix(exe_path.suffix + ".partial")
-        platform_dir = self.get_platform_dir()
-        platform_dir.mkdir(parents=True, exist_ok=True)
-
+        announced = False
         last_logged_percent = -1
 
-        for attempt in range(1, max_retries + 1):
-            try:
-                downloaded = 0
-                if temp_path.exists():
-                    downloaded = temp_path.stat().st_size
-
-                headers = {}
-                if downloaded > 0:
-                    headers["Range"] = f"bytes={downloaded}-"
+        def on_progress(done: int, total: int) -> None:
+            nonlocal announced, last_logged_percent
+            if not announced:
+                announced = True
+                log_widget.write(
+                    Text.assemble(_STYLED["downloading"], f" Total: {total / (1024 * 1024):.1f} MB")
+                )
+            if total > 0:
+                progress_bar.update_progress(done, total)
+                current_percent = int((done / total) * 10) * 10
+                if current_percent > last_logged_percent:
+                    last_logged_percent = current_percent
+                    mb_downloaded = done / (1024 * 1024)
+                    mb_total = total / (1024 * 1024)
                     log_widget.write(
-                        f"[cyan]Resuming from {downloaded / (1024 * 1024):.1f} MB...[/cyan]"
-                    )
-
-                async with httpx.AsyncClient(
-                    follow_redirects=True,
-                    timeout=httpx.Timeout(30.0, read=60.0, connect=30.0),
-                    verify=True,
-                    limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-                ) as client:
-                    async with client.stream("GET", url, headers=headers) as response:
-                        if response.status_code == 206:
-                            content_range = response.headers.get("content-range", "")
-                            if "/" in content_range:
-                                total = int(content_range.split("/")[1])
-                            else:
-                                total = downloaded + int(
-                                    response.headers.get("content-length", 0)
-                                )
-                            mode = "ab"
-                        elif response.status_code == 200:
-                            total = int(response.headers.get("content-length", 0))
-                            downloaded = 0
-                            mode = "wb"
-                        else:
-                            response.raise_for_status()
-                            continue
-
-                        log_widget.write(f"[cyan]Downloading SlipNet...[/cyan] Total: {total / (1024 * 1024):.1f} MB")
-
-                        with open(temp_path, mode) as f:
-                            async for chunk in response.aiter_bytes(chunk_size=32768):
-                                f.write(chunk)
-                                downloaded += len(chunk)
-                                if total > 0:
-                                    progress_bar.update_progress(downloaded, total)
-                                    current_percent = int((downloaded / total) * 10) * 10
-                                    if current_percent > last_logged_percent:
-                                        last_logged_percent = current_percent
-                                        mb_downloaded = downloaded / (1024 * 1024)
-                                        mb_total = total / (1024 * 1024)
-                                        log_widget.write(
-                                            f"[dim]Progress: {mb_downloaded:.1f}/{mb_total:.1f} MB ({current_percent}%)[/dim]"
-                                        )
-
-                if temp_path.exists():
-                    if exe_path.exists():
-                        exe_path.unlink()
-                    temp_path.rename(exe_path)
-
-                if self.system in ("Linux", "Darwin"):
-                    exe_path.chmod(
-                        exe_path.stat().st_mode
-                        | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+                        Text(
+                            f"Progress: {mb_downloaded:.1f}/{mb_total:.1f} MB ({current_percent}%)",
+                            "dim",
+                        )
                     )
-                    log_widget.write("[green]✓ Set executable permissions on SlipNet client[/green]")
-
-                return True
-
-            except (
-                httpx.TimeoutException, httpx.NetworkError,
-                httpx.HTTPStatusError, httpx.ConnectError,
-            ) as e:
-                error_msg = f"{type(e).__name__}"
-                if hasattr(e, "__cause__") and e.__cause__:
-                    error_msg += f": {str(e.__cause__)}"
-                log_widget.write(f"[yellow]Retry {attempt}/{max_retries}: {error_msg}[/yellow]")
-                if attempt < max_retries:
-                    log_widget.write(f"[dim]Waiting {retry_delay * attempt:.0f}s before retry...[/dim]")
-                    await asyncio.sleep(retry_delay * attempt)
-                    continue
-                else:
-                    return False
-            except Exception as e:
-                log_widget.write(f"[red]Unexpected error: {type(e).__name__}: {e}[/red]")
-                if temp_path.exists():
-                    temp_path.unlink()
-                return False
 
-        return False
+        return await self._download_core(
+            on_progress,
+            log_widget.write,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            interval=_UI_PROGRESS_INTERVAL,
+        )
 
     # ── Command builder ─────────────────────────────────────────────────
 
@@ -461,3 +414,4 @@ class SlipNetManager:
             cmd += ["--query-size", str(query_size)]
         cmd.append(slipnet_url)
         return cmd
+
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import functools
-import platform
+import os
 import subprocess
 import sys
 import threading
+import time
+from typing import Optional
 
-from .constants import _ANSI_ESCAPE_RE, logger
+import httpx
+
+from .constants import _ANSI_ESCAPE_RE
 
 
 # ---------------------------------------------------------------------------
@@ -59,6 +64,210 @@ def _run_tunnel_sync(
     return proc, connection_ready, lines
 
 
+# ---------------------------------------------------------------------------
+# Platform helpers (shared by the tunnel-client managers)
+# ---------------------------------------------------------------------------
+
+_X86_ALIASES = frozenset({"x86_64", "AMD64", "i386", "i686", "x86"})
+_ARM64_ALIASES = frozenset({"aarch64", "arm64", "armv8l"})
+
+
+@functools.lru_cache(maxsize=None)
+def _normalize_machine(machine: str) -> str:
+    """Map a ``platform.machine()`` string onto the release arch names."""
+    if machine in _X86_ALIASES:
+        return "x86_64"
+    if machine in _ARM64_ALIASES or machine.startswith("arm"):
+        return "arm64"
+    return machine
+
+
+_SYSTEM_NAMES = {
+    "win32": "Windows",
+    "darwin": "Darwin",
+    "linux": "Linux",
+    "android": "Android",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_platform() -> tuple[str, str]:
+    """Return the normalized ``(system, machine)`` pair for this host.
+
+    Uses ``sys.platform`` and ``os.uname()`` / ``PROCESSOR_ARCHITECTURE``
+    rather than ``platform.system()`` / ``platform.machine()``.
+    """
+    if sys.platform == "win32":
+        machine = os.environ.get("PROCESSOR_ARCHITEW6432") or os.environ.get(
+            "PROCESSOR_ARCHITECTURE", "AMD64"
+        )
+        return "Windows", _normalize_machine(machine)
+
+    uname = os.uname()
+    machine = _normalize_machine(uname.machine)
+    if (
+        os.environ.get("ANDROID_ROOT")
+        or os.environ.get("ANDROID_DATA")
+        or os.environ.get("TERMUX_VERSION")
+        or os.path.exists("/data/data/com.termux")
+        or os.path.exists("/system/build.prop")
+    ):
+        return "Android", machine
+    return _SYSTEM_NAMES.get(sys.platform, uname.sysname), machine
+
+
+# (system, machine) -> release key; "*" matches any machine.
+_PLATFORM_KEYS = {
+    ("Windows", "*"): "Windows",
+    ("Android", "*"): "Android",
+    ("Linux", "x86_64"): "Linux-x86_64",
+    ("Linux", "arm64"): "Linux-arm64",
+    ("Darwin", "x86_64"): "Darwin-x86_64",
+    ("Darwin", "arm64"): "Darwin-arm64",
+}
+
+
+def _lookup_platform_key(system: str, machine: str) -> Optional[str]:
+    """Return the release key for *system*/*machine*, or None if unsupported."""
+    return _PLATFORM_KEYS.get((system, machine)) or _PLATFORM_KEYS.get((system, "*"))
+
+
+def _ordered_candidates(
+    filenames: dict[str, str], alt_filenames: dict[str, list[str]]
+) -> dict[str, tuple[str, ...]]:
+    """Per platform key: alt names first, then the release name, de-duplicated."""
+    return {
+        key: tuple(dict.fromkeys([*alt_filenames.get(key, []), filename]))
+        for key, filename in filenames.items()
+    }
+
+
+# ---------------------------------------------------------------------------
+# Binary download (urllib transfer driven from a worker thread)
+# ---------------------------------------------------------------------------
+
+DOWNLOAD_CHUNK = 1 << 20
+_PROGRESS_INTERVAL = 0.25
+_UI_PROGRESS_INTERVAL = 0.05  # ~20 Hz for the on-screen progress bar
+
+
+def _sync_download(
+    url: str,
+    temp_path,
+    headers: dict,
+    downloaded: int,
+    progress_cb=None,
+    timeout: float = 60.0,
+    interval: float = _PROGRESS_INTERVAL,
+    cancel: Optional[threading.Event] = None,
+) -> tuple:
+    """Blocking ranged download of *url* into *temp_path*.
+
+    Designed to run in a background thread (via asyncio.to_thread).  A 206
+    response appends to the partial file, a 200 response restarts it.
+    *progress_cb(downloaded, total)* is called from the worker thread, at
+    most every *interval* seconds plus once on completion.  Setting *cancel*
+    stops the transfer after the current chunk, leaving the partial file
+    for a later resume.
+
+    Returns:
+        (downloaded, total)
+    """
+    import urllib.request
+
+    request = urllib.request.Request(url, headers=headers)
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        if response.status == 206:
+            content_range = response.headers.get("Content-Range", "")
+            if "/" in content_range:
+                total = int(content_range.split("/")[1])
+            else:
+                total = downloaded + int(response.headers.get("Content-Length", 0))
+            mode = "ab"
+        else:
+            total = int(response.headers.get("Content-Length", 0))
+            downloaded = 0
+            mode = "wb"
+
+        if progress_cb:
+            progress_cb(downloaded, total)
+
+        # Raw fd writes: no BufferedWriter copy for a write-once file.
+        flags = (
+            os.O_WRONLY | os.O_CREAT
+            | getattr(os, "O_BINARY", 0) | getattr(os, "O_SEQUENTIAL", 0)
+            | (os.O_APPEND if mode == "ab" else os.O_TRUNC)
+        )
+        fd = os.open(temp_path, flags, 0o644)
+        try:
+            last_report = time.monotonic()
+            while chunk := response.read(DOWNLOAD_CHUNK):
+                if cancel is not None and cancel.is_set():
+                    return downloaded, total
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(fd, view):]
+                downloaded += len(chunk)
+                if progress_cb:
+                    now = time.monotonic()
+                    if now - last_report >= interval:
+                        last_report = now
+                        progress_cb(downloaded, total)
+            # The binary is only ever exec'd, never read back — keep it
+            # out of the page cache.
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+    if progress_cb:
+        progress_cb(downloaded, total)
+    return downloaded, total
+
+
+async def _stream_to_file(
+    url: str,
+    temp_path,
+    headers: dict,
+    downloaded: int,
+    progress_cb=None,
+    interval: float = _PROGRESS_INTERVAL,
+) -> tuple:
+    """Resolve *url* with an httpx HEAD, then transfer the body via urllib.
+
+    httpx handles the GitHub release redirect chain; the byte transfer runs
+    in a thread so large reads don't bounce through the event loop per chunk.
+    *progress_cb* is marshalled back onto the running loop.  Cancelling the
+    awaiting task also stops the worker thread at its next chunk.
+    """
+    async with httpx.AsyncClient(
+        follow_redirects=True,
+        timeout=httpx.Timeout(30.0, read=60.0, connect=30.0),
+        verify=True,
+    ) as client:
+        head = await client.head(url)
+        head.raise_for_status()
+        final_url = str(head.url)
+
+    report = None
+    if progress_cb:
+        loop = asyncio.get_running_loop()
+
+        def _report(done: int, total: int) -> None:
+            loop.call_soon_threadsafe(progress_cb, done, total)
+
+        report = _report
+
+    cancel = threading.Event()
+    try:
+        return await asyncio.to_thread(
+            _sync_download, final_url, temp_path, headers, downloaded, report,
+            interval=interval, cancel=cancel,
+        )
+    except asyncio.CancelledError:
+        cancel.set()
+        raise
+
 
 # ---------------------------------------------------------------------------
 # Bell / notification sound
@@ -71,12 +280,14 @@ def _play_bell_sound() -> None:
     thread so it never stalls the event loop.
     """
 
+    system = _detect_platform()[0]
+
     def _beep_blocking():
         try:
-            if platform.system() == "Windows":
+            if system == "Windows":
                 import winsound
                 winsound.Beep(1400, 60)
-            elif platform.system() == "Darwin":
+            elif system == "Darwin":
                 try:
                     subprocess.run(
                         ["afplay", "/System/Library/Sounds/Tink.aiff"],
@@ -106,12 +317,15 @@ def _format_time(response_time: float) -> str:
     return _format_time_ms(ms)
 
 
+# Response-time markup, picked by latency band.
+_TIME_FMT_FAST = "[green]{}ms[/green]"
+_TIME_FMT_MED = "[yellow]{}ms[/yellow]"
+_TIME_FMT_SLOW = "[red]{}ms[/red]"
+
+
 @functools.lru_cache(maxsize=1024)
 def _format_time_ms(ms: int) -> str:
     """Cached formatter for integer-ms values."""
-    if ms < 100:
-        return f"[green]{ms}ms[/green]"
-    elif ms < 300:
-        return f"[yellow]{ms}ms[/yellow]"
-    return f"[red]{ms}ms[/red]"
+    fmt = _TIME_FMT_FAST if ms < 100 else _TIME_FMT_MED if ms < 300 else _TIME_FMT_SLOW
+    return fmt.format(ms)
 
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import time
+from pathlib import Path
+
 from rich.text import Text
 from textual.app import ComposeResult
 from textual.widget import Widget
@@ -27,13 +30,26 @@ class PlainDirectoryTree(DirectoryTree):
     ICON_FOLDER_OPEN = "[DIR]  "
     ICON_FILE = "[FILE] "
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # path -> is_dir(), so repaints don't stat() every visible row.
+        self._is_dir_cache: dict[Path, bool] = {}
+
+    def reload(self):
+        self._is_dir_cache.clear()
+        return super().reload()
+
     def render_label(self, node, base_style, style):
         """Override render to ensure plain icons are used."""
         node_label = node._label
         icon = self.ICON_FILE
 
         if isinstance(node.data, DirEntry):
-            if node.data.path.is_dir():
+            path = node.data.path
+            is_dir = self._is_dir_cache.get(path)
+            if is_dir is None:
+                is_dir = self._is_dir_cache[path] = path.is_dir()
+            if is_dir:
                 icon = self.ICON_FOLDER_OPEN if node.is_expanded else self.ICON_FOLDER
 
         label = Text(icon, style=base_style + style) if icon else Text()
@@ -73,6 +89,10 @@ class StatsWidget(Widget):
     """
 
     BAR_WIDTH = 38
+    REPAINT_INTERVAL = 0.5
+    SCANNED_STEP = 50
+    _BAR_FULL = "█" * BAR_WIDTH
+    _BAR_EMPTY = "░" * BAR_WIDTH
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -105,6 +125,15 @@ class StatsWidget(Widget):
         self._w_time = Static("")
         self._w_gap2 = Static("")
         self._w_bar = Static("")
+        # Last markup pushed to each row; unchanged rows skip update() and
+        # the Rich markup re-parse that comes with it.
+        self._rendered: dict[Static, str] = {}
+        self._bar_key: tuple[int, int] | None = None
+        self._bar_str: str = ""
+        # Coarse fingerprint of the last paint; small scanned/current_ip
+        # moves inside REPAINT_INTERVAL reuse the rows already on screen.
+        self._paint_key: tuple | None = None
+        self._last_paint_mono: float = 0.0
 
     def compose(self) -> ComposeResult:
         yield self._w_header
@@ -136,7 +165,7 @@ class StatsWidget(Widget):
         bar_progress: float | None = None,
         bar_total: float | None = None,
     ) -> None:
-        """Batch-update any subset of stats, then redraw each row."""
+        """Batch-update any subset of stats, then redraw rows whose text changed."""
         if scanned is not None:
             self.scanned = scanned
         if found is not None:
@@ -165,6 +194,29 @@ class StatsWidget(Widget):
             self._bar_progress = bar_progress
         if bar_total is not None:
             self._bar_total = bar_total
+
+        paint_key = (
+            self.scanned // self.SCANNED_STEP,
+            self.found,
+            self.passed,
+            self.failed,
+            self.secure,
+            self.normal,
+            self.filtered,
+            self.total,
+            int(self.elapsed),
+            self.current_range,
+            self._bar_total,
+            int(self._bar_progress * 1000 / self._bar_total) if self._bar_total > 0 else 0,
+        )
+        now = time.monotonic()
+        if (
+            paint_key == self._paint_key
+            and now - self._last_paint_mono < self.REPAINT_INTERVAL
+        ):
+            return
+        self._paint_key = paint_key
+        self._last_paint_mono = now
         self._refresh_rows()
 
     def _refresh_rows(self) -> None:
@@ -183,36 +235,46 @@ class StatsWidget(Widget):
             ratio = max(0.0, min(1.0, bar_progress / bar_total))
         else:
             ratio = 0.0
-        percent = ratio * 100
         filled = int(ratio * self.BAR_WIDTH)
-        empty = max(0, self.BAR_WIDTH - filled)
-        bar_str = (
-            f"[#22c55e]{'█' * filled}[/#22c55e]"
-            f"[grey35]{'░' * empty}[/grey35]"
-            f" [bold cyan]{percent:5.1f}%[/bold cyan]"
-        )
+        permille = int(ratio * 1000)
+        # Rebuild only when a cell or the displayed 0.1% step changes.
+        if (filled, permille) != self._bar_key:
+            self._bar_key = (filled, permille)
+            self._bar_str = (
+                f"[#22c55e]{self._BAR_FULL[:filled]}[/#22c55e]"
+                f"[grey35]{self._BAR_EMPTY[filled:]}[/grey35]"
+                f" [bold cyan]{permille / 10:5.1f}%[/bold cyan]"
+            )
 
-        self._w_scan.update(f"[yellow]Scan:[/yellow]  {scan_ratio}")
-        self._w_now.update(
-            f"[yellow]Now:[/yellow]   {range_val}[dim] > [/dim]{ip_val}"
+        self._set_row(self._w_scan, f"[yellow]Scan:[/yellow]  {scan_ratio}")
+        self._set_row(
+            self._w_now,
+            f"[yellow]Now:[/yellow]   {range_val}[dim] > [/dim]{ip_val}",
         )
-        self._w_dns.update(
+        self._set_row(
+            self._w_dns,
             f"[yellow]DNS:[/yellow]   "
             f"[#fbbf24]{self.found}[/#fbbf24]"
             f"[dim] / [/dim]"
             f"[#22c55e]{self.passed}[/#22c55e]"
             f"[dim] / [/dim]"
-            f"[#ef4444]{self.failed}[/#ef4444]"
+            f"[#ef4444]{self.failed}[/#ef4444]",
         )
-        self._w_sec.update(
+        self._set_row(
+            self._w_sec,
             f"[yellow]SEC:[/yellow]   "
             f"[#4ade80]{self.secure}[/#4ade80]"
             f"[dim] / [/dim]"
             f"[#60a5fa]{self.normal}[/#60a5fa]"
             f"[dim] / [/dim]"
-            f"[#fb923c]{self.filtered}[/#fb923c]"
+            f"[#fb923c]{self.filtered}[/#fb923c]",
         )
-        self._w_speed.update(f"[yellow]Speed:[/yellow] {self.speed:.1f} IPs/sec")
-        self._w_time.update(f"[yellow]Time:[/yellow]  {self.elapsed:.1f}s")
-        self._w_bar.update(bar_str)
+        self._set_row(self._w_speed, f"[yellow]Speed:[/yellow] {self.speed:.1f} IPs/sec")
+        self._set_row(self._w_time, f"[yellow]Time:[/yellow]  {self.elapsed:.1f}s")
+        self._set_row(self._w_bar, self._bar_str)
+
+    def _set_row(self, widget: Static, markup: str) -> None:
+        if self._rendered.get(widget) != markup:
+            self._rendered[widget] = markup
+            widget.update(markup)
 